@@ -7,7 +7,9 @@ class EvaluationContext:
         if not (self and ctx2):
             return self or ctx2
 
-        self.attributes = {**self.attributes, **ctx2.attributes}
-        self.targeting_key = ctx2.targeting_key or self.targeting_key
-
-        return self
+        # merge into a new context: the API level context is a shared global which
+        # would otherwise accumulate the attributes of every evaluation
+        return EvaluationContext(
+            targeting_key=ctx2.targeting_key or self.targeting_key,
+            attributes={**self.attributes, **ctx2.attributes},
+        )
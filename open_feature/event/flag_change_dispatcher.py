@@ -0,0 +1,167 @@
+import asyncio
+import logging
+import threading
+import typing
+from collections import deque
+
+FlagChangeCallback = typing.Callable[[typing.FrozenSet[str]], typing.Any]
+
+
+class FlagChangeSubscription:
+    """
+    Handle returned by OpenFeatureClient.on_flag_changed.
+    """
+
+    def __init__(
+        self,
+        dispatcher: "FlagChangeDispatcher",
+        keys: typing.Optional[typing.FrozenSet[str]],
+        callback: FlagChangeCallback,
+        loop: typing.Optional[asyncio.AbstractEventLoop],
+    ):
+        self.keys = keys
+        self.callback = callback
+        self.loop = loop
+        self.active = True
+        self._dispatcher = dispatcher
+
+    def unsubscribe(self):
+        self._dispatcher.unsubscribe(self)
+
+
+class FlagChangeDispatcher:
+    """
+    Delivers flag change notifications from providers to subscribers, off the
+    thread which applied the change. Each subscriber is called with the keys of
+    the changed flags it subscribed to, either on the dispatcher thread or on its
+    asyncio event loop.
+
+    Notifications are coalesced: while a delivery to a subscriber is pending, the
+    keys of further changes are merged into it, so a burst of changes costs the
+    subscriber a single call.
+    """
+
+    def __init__(self):
+        self._subscriptions: typing.Tuple[FlagChangeSubscription, ...] = ()
+        self._pending: typing.Dict[FlagChangeSubscription, typing.Set[str]] = {}
+        self._queue: typing.Deque[FlagChangeSubscription] = deque()
+        self._condition = threading.Condition()
+        self._thread: typing.Optional[threading.Thread] = None
+        self._closed = False
+
+    def subscribe(
+        self,
+        keys: typing.Optional[typing.Iterable[str]],
+        callback: FlagChangeCallback,
+        loop: asyncio.AbstractEventLoop = None,
+    ) -> FlagChangeSubscription:
+        """
+        :param keys: the keys of the flags to be notified of, None for every flag
+        :param callback: called with the frozenset of the changed keys
+        :param loop: the event loop the callback is called on, by default it is
+        called on the dispatcher thread. Coroutine functions are scheduled as tasks
+        on the loop, or run to completion on the dispatcher thread
+        :return: the subscription
+        """
+        subscription = FlagChangeSubscription(
+            self, None if keys is None else frozenset(keys), callback, loop
+        )
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The flag change dispatcher is closed")
+            self._subscriptions = self._subscriptions + (subscription,)
+        return subscription
+
+    def unsubscribe(self, subscription: FlagChangeSubscription):
+        with self._condition:
+            subscription.active = False
+            self._subscriptions = tuple(
+                registered
+                for registered in self._subscriptions
+                if registered is not subscription
+            )
+            self._pending.pop(subscription, None)
+
+    def close(self, timeout: float = None):
+        """
+        End every subscription and stop the dispatcher thread, pending
+        notifications are dropped.
+
+        :param timeout: seconds to wait for a delivery in progress to finish
+        """
+        with self._condition:
+            self._closed = True
+            for subscription in self._subscriptions:
+                subscription.active = False
+            self._subscriptions = ()
+            self._pending.clear()
+            self._queue.clear()
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def notify(self, changed_keys: typing.FrozenSet[str]):
+        """
+        Flag change listener registered on the provider.
+
+        :param changed_keys: the keys of the flags which changed
+        """
+        with self._condition:
+            for subscription in self._subscriptions:
+                keys = (
+                    changed_keys
+                    if subscription.keys is None
+                    else changed_keys & subscription.keys
+                )
+                if not keys:
+                    continue
+                pending = self._pending.get(subscription)
+                if pending is not None:
+                    pending.update(keys)
+                    continue
+                self._pending[subscription] = set(keys)
+                if subscription.loop is not None:
+                    try:
+                        subscription.loop.call_soon_threadsafe(
+                            self._deliver, subscription
+                        )
+                    except RuntimeError:
+                        # the loop is closed, nobody is left to notify
+                        self._pending.pop(subscription)
+                else:
+                    self._queue.append(subscription)
+                    self._start_thread()
+                    self._condition.notify()
+
+    def _start_thread(self):
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="open-feature-flag-changes", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._queue and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                subscription = self._queue.popleft()
+            self._deliver(subscription)
+
+    def _deliver(self, subscription: FlagChangeSubscription):
+        with self._condition:
+            keys = self._pending.pop(subscription, None)
+        if not keys or not subscription.active:
+            return
+        try:
+            result = subscription.callback(frozenset(keys))
+            if asyncio.iscoroutine(result):
+                if subscription.loop is not None:
+                    subscription.loop.create_task(result)
+                else:
+                    asyncio.run(result)
+        except Exception:
+            logging.exception("Exception when delivering flag changes")
@@ -10,9 +10,11 @@ class FlagEvaluationDetails:
         reason: Reason,
         error_code: ErrorCode = None,
         variant=None,
+        error_message: str = None,
     ):
         self.key = key
         self.value = value
         self.reason = reason
         self.error_code = error_code
         self.variant = variant
+        self.error_message = error_message
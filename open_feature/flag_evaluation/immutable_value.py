@@ -0,0 +1,39 @@
+import typing
+from collections.abc import Mapping
+from types import MappingProxyType
+
+
+def freeze(value: typing.Any) -> typing.Any:
+    """
+    Build a read-only copy of an object flag value which can be shared between
+    every caller without the risk of one of them mutating it. Mappings become
+    MappingProxyType views, lists and tuples become tuples and sets become
+    frozensets, recursively. Scalars are returned unchanged.
+
+    :param value: the flag value, usually decoded from JSON
+    :return: a deeply immutable equivalent of the value
+    """
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: typing.Any) -> typing.Any:
+    """
+    Build a mutable copy of a value returned by freeze, for callers which need to
+    modify an object flag value or serialize it.
+
+    :param value: a value built by freeze
+    :return: an equivalent value made of dicts and lists
+    """
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(v) for v in value]
+    if isinstance(value, frozenset):
+        return {thaw(v) for v in value}
+    return value
@@ -6,5 +6,6 @@ class Reason(Enum):
     SPLIT = "SPLIT"
     TARGETING_MATCH = "TARGETING_MATCH"
     DEFAULT = "DEFAULT"
+    CACHED = "CACHED"
     UNKNOWN = "UNKNOWN"
     ERROR = "ERROR"
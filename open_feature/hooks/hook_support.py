@@ -10,6 +10,40 @@ from open_feature.hooks.hook_context import HookContext
 from open_feature.hooks.hook_type import HookType
 
 
+def hook_implements(hook: Hook, hook_type: HookType) -> bool:
+    """
+    Check whether a hook overrides the given stage of the Hook base class. Objects
+    which are not Hook subclasses are assumed to implement every stage.
+
+    :param hook: the hook to inspect
+    :param hook_type: the stage to look for
+    :return: True if the stage needs to be called for this hook
+    """
+    if not isinstance(hook, Hook):
+        return True
+    method = hook_type.value
+    if method in getattr(hook, "__dict__", {}):
+        return True
+    return getattr(type(hook), method) is not getattr(Hook, method)
+
+
+def hooks_by_stage(
+    hooks: typing.List[Hook],
+) -> typing.Dict[HookType, typing.List[Hook]]:
+    """
+    Split hooks into one list per stage, keeping only the hooks which implement
+    the stage, so that stages nobody implements cost nothing at evaluation time.
+    Computed once when hooks are registered.
+
+    :param hooks: a list of hooks, in registration order
+    :return: the hooks implementing each stage, in registration order
+    """
+    return {
+        hook_type: [hook for hook in hooks if hook_implements(hook, hook_type)]
+        for hook_type in HookType
+    }
+
+
 def error_hooks(
     flag_type: FlagType,
     hook_context: HookContext,
@@ -17,7 +51,9 @@ def error_hooks(
     hooks: typing.List[Hook],
     hints: dict,
 ):
-    kwargs = {"ctx": hook_context, "exception": exception, "hints": hints}
+    if not hooks:
+        return
+    kwargs = {"hook_context": hook_context, "exception": exception, "hints": hints}
     _execute_hooks(
         flag_type=flag_type, hooks=hooks, hook_method=HookType.ERROR, **kwargs
     )
@@ -29,7 +65,9 @@ def after_all_hooks(
     hooks: typing.List[Hook],
     hints: dict,
 ):
-    kwargs = {"ctx": hook_context, "hints": hints}
+    if not hooks:
+        return
+    kwargs = {"hook_context": hook_context, "hints": hints}
     _execute_hooks(
         flag_type=flag_type, hooks=hooks, hook_method=HookType.FINALLY_AFTER, **kwargs
     )
@@ -42,7 +80,9 @@ def after_hooks(
     hooks: typing.List[Hook],
     hints: dict,
 ):
-    kwargs = {"ctx": hook_context, "details": details, "hints": hints}
+    if not hooks:
+        return
+    kwargs = {"hook_context": hook_context, "details": details, "hints": hints}
     _execute_hooks_unchecked(
         flag_type=flag_type, hooks=hooks, hook_method=HookType.AFTER, **kwargs
     )
@@ -54,7 +94,9 @@ def before_hooks(
     hooks: typing.List[Hook],
     hints: dict,
 ) -> EvaluationContext:
-    kwargs = {"ctx": hook_context, "hints": hints}
+    if not hooks:
+        return EvaluationContext()
+    kwargs = {"hook_context": hook_context, "hints": hints}
     executed_hooks = _execute_hooks_unchecked(
         flag_type=flag_type, hooks=hooks, hook_method=HookType.BEFORE, **kwargs
     )
@@ -0,0 +1,75 @@
+import asyncio
+import typing
+
+from open_feature.evaluation_context.evaluation_context import EvaluationContext
+from open_feature.middleware.request_session import _current_session
+from open_feature.middleware.route_flag_learner import RouteFlagLearner
+from open_feature.open_feature_client import OpenFeatureClient
+
+SESSION_SCOPE_KEY = "openfeature.session"
+
+
+def default_route_key(scope: dict) -> str:
+    return f"{scope.get('method', '')} {scope.get('path', '')}"
+
+
+class OpenFeatureASGIMiddleware:
+    """
+    ASGI counterpart of the OpenFeatureWSGIMiddleware. Each http request is served
+    with an OpenFeatureEvaluationSession, available in the scope under
+    "openfeature.session" and through current_session(), and the flags learned
+    for its route are prefetched with a single batch call to the provider before
+    the application runs, on the default executor of the event loop. Other scope
+    types are passed through untouched.
+    """
+
+    def __init__(
+        self,
+        app: typing.Callable,
+        client: OpenFeatureClient,
+        context_builder: typing.Callable[[dict], EvaluationContext] = None,
+        route_key: typing.Callable[[dict], str] = default_route_key,
+        learner: RouteFlagLearner = None,
+    ):
+        """
+        :param app: the ASGI application to wrap
+        :param client: the client the sessions evaluate flags with
+        :param context_builder: builds the evaluation context of a request from
+        its scope
+        :param route_key: identifies the route of a request from its scope. The
+        default uses the method and the path, applications with parameters in
+        their paths should pass their route template instead
+        :param learner: remembers the flags of each route
+        """
+        self.app = app
+        self.client = client
+        self.context_builder = context_builder
+        self.route_key = route_key
+        self.learner = learner or RouteFlagLearner()
+
+    async def __call__(
+        self, scope: dict, receive: typing.Callable, send: typing.Callable
+    ):
+        if scope.get("type") != "http":
+            await self.app(scope, receive, send)
+            return
+
+        evaluation_context = (
+            self.context_builder(scope) if self.context_builder else None
+        )
+        session = self.client.evaluation_session(evaluation_context)
+        route = self.route_key(scope)
+        flags = self.learner.flags(route)
+        if flags:
+            # providers are synchronous, keep their round trip off the event loop
+            await asyncio.get_running_loop().run_in_executor(
+                None, session.prefetch, flags
+            )
+
+        scope = {**scope, SESSION_SCOPE_KEY: session}
+        token = _current_session.set(session)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_session.reset(token)
+            self.learner.learn(route, session.evaluated_flags())
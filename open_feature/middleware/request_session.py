@@ -0,0 +1,16 @@
+import typing
+from contextvars import ContextVar
+
+from open_feature.open_feature_evaluation_session import OpenFeatureEvaluationSession
+
+_current_session: ContextVar[
+    typing.Optional[OpenFeatureEvaluationSession]
+] = ContextVar("open_feature_session", default=None)
+
+
+def current_session() -> typing.Optional[OpenFeatureEvaluationSession]:
+    """
+    :return: the evaluation session of the request being served by one of the
+    OpenFeature middlewares, None outside of a request
+    """
+    return _current_session.get()
@@ -0,0 +1,60 @@
+import threading
+import typing
+from collections import OrderedDict
+
+from open_feature.flag_evaluation.flag_type import FlagType
+
+Flag = typing.Tuple[FlagType, str, typing.Any]
+
+
+class RouteFlagLearner:
+    """
+    Remembers which flags the requests of each route evaluate, so that the next
+    requests of the route can prefetch them all at once. Bounded in both the
+    number of routes, least recently used first out, and the number of flags per
+    route. Safe to share between threads.
+    """
+
+    def __init__(self, max_routes: int = 1024, max_flags_per_route: int = 64):
+        """
+        :param max_routes: the number of routes remembered
+        :param max_flags_per_route: the number of flags remembered for each route
+        """
+        self.max_routes = max_routes
+        self.max_flags_per_route = max_flags_per_route
+        self._routes: typing.OrderedDict[
+            str, typing.Dict[typing.Tuple[str, FlagType], Flag]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def flags(self, route: str) -> typing.List[Flag]:
+        """
+        :param route: the route about to be served
+        :return: the (flag type, key, default value) of the flags evaluated by
+        earlier requests of the route
+        """
+        with self._lock:
+            flags = self._routes.get(route)
+            if flags is None:
+                return []
+            self._routes.move_to_end(route)
+            return list(flags.values())
+
+    def learn(self, route: str, flags: typing.Iterable[Flag]):
+        """
+        :param route: the route which has just been served
+        :param flags: the (flag type, key, default value) of the flags it evaluated
+        """
+        with self._lock:
+            known = self._routes.get(route)
+            if known is None:
+                known = self._routes[route] = {}
+                while len(self._routes) > self.max_routes:
+                    self._routes.popitem(last=False)
+            else:
+                self._routes.move_to_end(route)
+            for flag_type, key, default_value in flags:
+                flag_key = (key, flag_type)
+                if flag_key in known or len(known) < self.max_flags_per_route:
+                    # the latest default is the most likely one for the next request
+                    known[flag_key] = (flag_type, key, default_value)
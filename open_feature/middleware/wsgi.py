@@ -0,0 +1,64 @@
+import typing
+
+from open_feature.evaluation_context.evaluation_context import EvaluationContext
+from open_feature.middleware.request_session import _current_session
+from open_feature.middleware.route_flag_learner import RouteFlagLearner
+from open_feature.open_feature_client import OpenFeatureClient
+
+SESSION_ENVIRON_KEY = "openfeature.session"
+
+
+def default_route_key(environ: dict) -> str:
+    return f"{environ.get('REQUEST_METHOD', '')} {environ.get('PATH_INFO', '')}"
+
+
+class OpenFeatureWSGIMiddleware:
+    """
+    Serves each request with an OpenFeatureEvaluationSession, available in the
+    environ under "openfeature.session" and through current_session(). The
+    evaluation context is built once per request, and the flags which earlier
+    requests of the same route evaluated are prefetched with a single batch call
+    to the provider before the application runs.
+
+    Flags evaluated while the response body is being iterated are not learned.
+    """
+
+    def __init__(
+        self,
+        app: typing.Callable,
+        client: OpenFeatureClient,
+        context_builder: typing.Callable[[dict], EvaluationContext] = None,
+        route_key: typing.Callable[[dict], str] = default_route_key,
+        learner: RouteFlagLearner = None,
+    ):
+        """
+        :param app: the WSGI application to wrap
+        :param client: the client the sessions evaluate flags with
+        :param context_builder: builds the evaluation context of a request from
+        its environ
+        :param route_key: identifies the route of a request from its environ. The
+        default uses the method and the path, applications with parameters in
+        their paths should pass their route template instead
+        :param learner: remembers the flags of each route
+        """
+        self.app = app
+        self.client = client
+        self.context_builder = context_builder
+        self.route_key = route_key
+        self.learner = learner or RouteFlagLearner()
+
+    def __call__(self, environ: dict, start_response: typing.Callable):
+        evaluation_context = (
+            self.context_builder(environ) if self.context_builder else None
+        )
+        session = self.client.evaluation_session(evaluation_context)
+        route = self.route_key(environ)
+        session.prefetch(self.learner.flags(route))
+
+        environ[SESSION_ENVIRON_KEY] = session
+        token = _current_session.set(session)
+        try:
+            return self.app(environ, start_response)
+        finally:
+            _current_session.reset(token)
+            self.learner.learn(route, session.evaluated_flags())
@@ -1,9 +1,17 @@
+import asyncio
 import logging
+import threading
 import typing
 from numbers import Number
 
 from open_feature.evaluation_context.evaluation_context import EvaluationContext
-from open_feature.exception.exceptions import GeneralError
+from open_feature.event.flag_change_dispatcher import (
+    FlagChangeCallback,
+    FlagChangeDispatcher,
+    FlagChangeSubscription,
+)
+from open_feature.exception.exceptions import GeneralError, OpenFeatureError
+from open_feature.flag_evaluation.error_code import ErrorCode
 from open_feature.flag_evaluation.flag_evaluation_details import FlagEvaluationDetails
 from open_feature.flag_evaluation.flag_type import FlagType
 from open_feature.flag_evaluation.reason import Reason
@@ -14,8 +22,11 @@ from open_feature.hooks.hook_support import (
     after_hooks,
     before_hooks,
     error_hooks,
+    hooks_by_stage,
 )
+from open_feature.hooks.hook_type import HookType
 from open_feature.open_feature_evaluation_context import api_evaluation_context
+from open_feature.open_feature_evaluation_session import OpenFeatureEvaluationSession
 from open_feature.provider.no_op_provider import NoOpProvider
 from open_feature.provider.provider import AbstractProvider
 
@@ -33,10 +44,96 @@ class OpenFeatureClient:
         self.version = version
         self.context = context or EvaluationContext()
         self.hooks = hooks or []
+        self._flag_change_dispatcher: typing.Optional[FlagChangeDispatcher] = None
+        self._flag_change_lock = threading.Lock()
         self.provider = provider
 
+    @property
+    def provider(self) -> typing.Optional[AbstractProvider]:
+        return self._provider
+
+    @provider.setter
+    def provider(self, provider: typing.Optional[AbstractProvider]):
+        with self._flag_change_lock:
+            dispatcher = self._flag_change_dispatcher
+            previous = getattr(self, "_provider", None)
+            if dispatcher is not None and previous is not None:
+                previous.remove_flag_change_listener(dispatcher.notify)
+            if dispatcher is not None and provider is not None:
+                provider.add_flag_change_listener(dispatcher.notify)
+            self._provider = provider
+
+    @property
+    def hooks(self) -> typing.Tuple[Hook, ...]:
+        # a tuple, so that hooks can only be registered through the setter or
+        # add_hooks, which keep the hooks of each stage up to date
+        return self._hooks
+
+    @hooks.setter
+    def hooks(self, hooks: typing.Iterable[Hook]):
+        # split the hooks by implemented stage once, when they are registered,
+        # instead of calling every stage of every hook on each evaluation
+        hooks = tuple(hooks)
+        self._stage_hooks = hooks_by_stage(hooks)
+        self._hooks = hooks
+
     def add_hooks(self, hooks: typing.List[Hook]):
-        self.hooks = self.hooks + hooks
+        self.hooks = self.hooks + tuple(hooks)
+
+    def on_flag_changed(
+        self,
+        keys: typing.Optional[typing.Iterable[str]],
+        callback: FlagChangeCallback,
+        loop: asyncio.AbstractEventLoop = None,
+    ) -> FlagChangeSubscription:
+        """
+        Subscribe to changes of flag definitions reported by the provider, so that
+        state derived from flags can be recomputed when, and only when, a flag it
+        depends on changed. Bursts of changes are coalesced into a single call.
+
+        :param keys: the keys of the flags to be notified of, None for every flag
+        :param callback: called with the frozenset of the changed keys among the
+        subscribed ones
+        :param loop: the asyncio event loop the callback is called on, by default
+        it is called on a dispatcher thread
+        :return: a FlagChangeSubscription whose unsubscribe method ends it, close
+        ends every subscription of the client
+        """
+        self._get_provider()
+        with self._flag_change_lock:
+            dispatcher = self._flag_change_dispatcher
+            if dispatcher is None:
+                dispatcher = self._flag_change_dispatcher = FlagChangeDispatcher()
+                self._provider.add_flag_change_listener(dispatcher.notify)
+            return dispatcher.subscribe(keys, callback, loop)
+
+    def close(self):
+        """
+        Release the resources held for flag change subscriptions: every
+        subscription ends, the dispatcher thread stops and its listener is removed
+        from the provider. Clients created per request should be closed once
+        done with if they subscribed to flag changes.
+        """
+        with self._flag_change_lock:
+            dispatcher = self._flag_change_dispatcher
+            self._flag_change_dispatcher = None
+            if dispatcher is not None and self._provider is not None:
+                self._provider.remove_flag_change_listener(dispatcher.notify)
+        if dispatcher is not None:
+            dispatcher.close()
+
+    def evaluation_session(
+        self, evaluation_context: EvaluationContext = None
+    ) -> OpenFeatureEvaluationSession:
+        """
+        Create a request scoped session which memoizes the evaluation of every flag
+        looked up through it.
+
+        :param evaluation_context: Information for the purposes of flag evaluation,
+        shared by every lookup made through the session
+        :return: an OpenFeatureEvaluationSession bound to this client
+        """
+        return OpenFeatureEvaluationSession(self, evaluation_context)
 
     def get_boolean_value(
         self,
@@ -165,6 +262,7 @@ class OpenFeatureClient:
         default_value: typing.Any,
         evaluation_context: EvaluationContext = None,
         flag_evaluation_options: typing.Any = None,
+        prefetched_details: FlagEvaluationDetails = None,
     ) -> FlagEvaluationDetails:
         """
         Evaluate the flag requested by the user from the clients provider.
@@ -174,6 +272,10 @@ class OpenFeatureClient:
         :param default_value: backup value returned if no result found by the provider
         :param evaluation_context: Information for the purposes of flag evaluation
         :param flag_evaluation_options: Additional flag evaluation information
+        :param prefetched_details: the provider result for this flag obtained
+        beforehand with prefetch_flag_details, used instead of calling the provider.
+        The hooks still run, so it must only be given when no before hook is
+        registered, as the context they return could not affect the result.
         :return: a FlagEvaluationDetails object with the fully evaluated flag from a
         provider
         """
@@ -189,46 +291,114 @@ class OpenFeatureClient:
             client_metadata=None,
             provider_metadata=None,
         )
-        merged_hooks = []
+        stage_hooks = self._stage_hooks
 
         try:
             # https://github.com/open-feature/spec/blob/main/specification/sections/03-evaluation-context.md
             # Any resulting evaluation context from a before hook will overwrite
             # duplicate fields defined globally, on the client, or in the invocation.
             invocation_context = before_hooks(
-                flag_type, hook_context, merged_hooks, None
+                flag_type, hook_context, stage_hooks[HookType.BEFORE], None
             )
-            invocation_context.merge(ctx2=evaluation_context)
+            invocation_context = invocation_context.merge(ctx2=evaluation_context)
 
             # merge of: API.context, client.context, invocation.context
             merged_context = (
                 api_evaluation_context().merge(self.context).merge(invocation_context)
             )
 
-            flag_evaluation = self.create_provider_evaluation(
+            if prefetched_details is not None:
+                flag_evaluation = prefetched_details
+            else:
+                flag_evaluation = self.create_provider_evaluation(
+                    flag_type,
+                    key,
+                    default_value,
+                    merged_context,
+                )
+
+            # Providers may report an expected failure such as a missing flag by
+            # returning error-bearing details instead of raising, which spares the
+            # cost of raising and unwinding an exception on every miss.
+            if flag_evaluation.error_code is not None:
+                if stage_hooks[HookType.ERROR]:
+                    error = OpenFeatureError(
+                        flag_evaluation.error_message, flag_evaluation.error_code
+                    )
+                    error_hooks(
+                        flag_type,
+                        hook_context,
+                        error,
+                        stage_hooks[HookType.ERROR],
+                        None,
+                    )
+                return FlagEvaluationDetails(
+                    key=key,
+                    value=default_value,
+                    reason=Reason.ERROR,
+                    error_code=flag_evaluation.error_code,
+                    error_message=flag_evaluation.error_message,
+                )
+
+            after_hooks(
                 flag_type,
-                key,
-                default_value,
-                merged_context,
+                hook_context,
+                flag_evaluation,
+                stage_hooks[HookType.AFTER],
+                None,
             )
 
-            after_hooks(type, hook_context, flag_evaluation, merged_hooks, None)
-
             return flag_evaluation
 
+        except OpenFeatureError as e:
+            error_hooks(flag_type, hook_context, e, stage_hooks[HookType.ERROR], None)
+            return FlagEvaluationDetails(
+                key=key,
+                value=default_value,
+                reason=Reason.ERROR,
+                error_code=e.error_code or ErrorCode.GENERAL,
+                error_message=e.error_message,
+            )
+
         # Catch any type of exception here since the user can provide any exception
         # in the error hooks
         except Exception as e:  # noqa
-            error_hooks(flag_type, hook_context, e, merged_hooks, None)
+            error_hooks(flag_type, hook_context, e, stage_hooks[HookType.ERROR], None)
             return FlagEvaluationDetails(
                 key=key,
                 value=default_value,
                 reason=Reason.ERROR,
-                error_code=e.error_message,
+                error_code=ErrorCode.GENERAL,
+                error_message=str(e),
             )
 
         finally:
-            after_all_hooks(flag_type, hook_context, merged_hooks, None)
+            after_all_hooks(
+                flag_type, hook_context, stage_hooks[HookType.FINALLY_AFTER], None
+            )
+
+    def prefetch_flag_details(
+        self,
+        flags: typing.List[typing.Tuple[FlagType, str, typing.Any]],
+        evaluation_context: EvaluationContext = None,
+    ) -> typing.List[FlagEvaluationDetails]:
+        """
+        Resolve several flags with a single batch call to the provider, without
+        running any hook. The results are meant to be handed to
+        evaluate_flag_details as prefetched_details when the flags are used, which
+        is only equivalent to resolving them then if the client has no before
+        hooks.
+
+        :param flags: the (flag type, key, default value) of each flag
+        :param evaluation_context: Information for the purposes of flag evaluation
+        :return: the provider FlagEvaluationDetails of each flag, in order
+        """
+        merged_context = (
+            api_evaluation_context()
+            .merge(self.context)
+            .merge(evaluation_context or EvaluationContext())
+        )
+        return self._get_provider().get_details_batch(flags, merged_context)
 
     def create_provider_evaluation(
         self,
@@ -253,18 +423,21 @@ class OpenFeatureClient:
             evaluation_context,
         )
 
-        if not self.provider:
-            logging.info("No provider configured, using no-op provider.")
-            self.provider = NoOpProvider()
-
+        provider = self._get_provider()
         get_details_callable = {
-            FlagType.BOOLEAN: self.provider.get_boolean_details,
-            FlagType.NUMBER: self.provider.get_number_details,
-            FlagType.OBJECT: self.provider.get_object_details,
-            FlagType.STRING: self.provider.get_string_details,
+            FlagType.BOOLEAN: provider.get_boolean_details,
+            FlagType.NUMBER: provider.get_number_details,
+            FlagType.OBJECT: provider.get_object_details,
+            FlagType.STRING: provider.get_string_details,
         }.get(flag_type)
 
         if not get_details_callable:
             raise GeneralError(error_message="Unknown flag type")
 
         return get_details_callable(*args)
+
+    def _get_provider(self) -> AbstractProvider:
+        if not self.provider:
+            logging.info("No provider configured, using no-op provider.")
+            self.provider = NoOpProvider()
+        return self.provider
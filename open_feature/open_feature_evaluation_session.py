@@ -0,0 +1,208 @@
+import logging
+import typing
+from numbers import Number
+
+from open_feature.evaluation_context.evaluation_context import EvaluationContext
+from open_feature.flag_evaluation.flag_evaluation_details import FlagEvaluationDetails
+from open_feature.flag_evaluation.flag_type import FlagType
+from open_feature.hooks.hook_type import HookType
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from open_feature.open_feature_client import OpenFeatureClient
+
+
+class OpenFeatureEvaluationSession:
+    """
+    A short lived, request scoped view of an OpenFeatureClient bound to a single
+    EvaluationContext. Each flag is evaluated through the client at most once per
+    (key, flag type) for the lifetime of the session, so repeated lookups are
+    served from memory, the caller sees one consistent value per flag and the
+    client hooks run only once per flag.
+
+    The default value passed on the first lookup of a flag is the one used for
+    the evaluation, later lookups of the same flag return the memoized details.
+    """
+
+    def __init__(
+        self,
+        client: "OpenFeatureClient",
+        evaluation_context: EvaluationContext = None,
+    ):
+        self.client = client
+        self.evaluation_context = evaluation_context or EvaluationContext()
+        self._details: typing.Dict[
+            typing.Tuple[str, FlagType], FlagEvaluationDetails
+        ] = {}
+        # prefetched details along with the default value they were resolved with
+        self._prefetched: typing.Dict[
+            typing.Tuple[str, FlagType], typing.Tuple[typing.Any, FlagEvaluationDetails]
+        ] = {}
+        self._defaults: typing.Dict[typing.Tuple[str, FlagType], typing.Any] = {}
+
+    def get_boolean_value(
+        self,
+        key: str,
+        default_value: bool,
+        flag_evaluation_options: typing.Any = None,
+    ) -> bool:
+        return self.evaluate_flag_details(
+            FlagType.BOOLEAN, key, default_value, flag_evaluation_options
+        ).value
+
+    def get_boolean_details(
+        self,
+        key: str,
+        default_value: bool,
+        flag_evaluation_options: typing.Any = None,
+    ) -> FlagEvaluationDetails:
+        return self.evaluate_flag_details(
+            FlagType.BOOLEAN, key, default_value, flag_evaluation_options
+        )
+
+    def get_string_value(
+        self,
+        key: str,
+        default_value: str,
+        flag_evaluation_options: typing.Any = None,
+    ) -> str:
+        return self.evaluate_flag_details(
+            FlagType.STRING, key, default_value, flag_evaluation_options
+        ).value
+
+    def get_string_details(
+        self,
+        key: str,
+        default_value: str,
+        flag_evaluation_options: typing.Any = None,
+    ) -> FlagEvaluationDetails:
+        return self.evaluate_flag_details(
+            FlagType.STRING, key, default_value, flag_evaluation_options
+        )
+
+    def get_number_value(
+        self,
+        key: str,
+        default_value: Number,
+        flag_evaluation_options: typing.Any = None,
+    ) -> Number:
+        return self.evaluate_flag_details(
+            FlagType.NUMBER, key, default_value, flag_evaluation_options
+        ).value
+
+    def get_number_details(
+        self,
+        key: str,
+        default_value: Number,
+        flag_evaluation_options: typing.Any = None,
+    ) -> FlagEvaluationDetails:
+        return self.evaluate_flag_details(
+            FlagType.NUMBER, key, default_value, flag_evaluation_options
+        )
+
+    def get_object_value(
+        self,
+        key: str,
+        default_value: dict,
+        flag_evaluation_options: typing.Any = None,
+    ) -> dict:
+        return self.evaluate_flag_details(
+            FlagType.OBJECT, key, default_value, flag_evaluation_options
+        ).value
+
+    def get_object_details(
+        self,
+        key: str,
+        default_value: dict,
+        flag_evaluation_options: typing.Any = None,
+    ) -> FlagEvaluationDetails:
+        return self.evaluate_flag_details(
+            FlagType.OBJECT, key, default_value, flag_evaluation_options
+        )
+
+    def evaluate_flag_details(
+        self,
+        flag_type: FlagType,
+        key: str,
+        default_value: typing.Any,
+        flag_evaluation_options: typing.Any = None,
+    ) -> FlagEvaluationDetails:
+        """
+        Return the memoized details for the flag, evaluating it through the client
+        on the first lookup.
+
+        :param flag_type: the type of the flag being returned
+        :param key: the string key of the selected flag
+        :param default_value: backup value returned if no result found by the provider
+        :param flag_evaluation_options: Additional flag evaluation information
+        :return: a FlagEvaluationDetails object shared by every lookup of the flag
+        within this session
+        """
+        cache_key = (key, flag_type)
+        details = self._details.get(cache_key)
+        if details is None:
+            self._defaults.setdefault(cache_key, default_value)
+            prefetched_details = None
+            prefetched = self._prefetched.pop(cache_key, None)
+            # providers may answer with the default value they were given, a
+            # result prefetched with another default cannot be used
+            if prefetched is not None and prefetched[0] == default_value:
+                prefetched_details = prefetched[1]
+            details = self.client.evaluate_flag_details(
+                flag_type,
+                key,
+                default_value,
+                self.evaluation_context,
+                flag_evaluation_options,
+                prefetched_details,
+            )
+            # setdefault keeps the first stored result if another thread raced us
+            details = self._details.setdefault(cache_key, details)
+        return details
+
+    def prefetch(self, flags: typing.Iterable[typing.Tuple[FlagType, str, typing.Any]]):
+        """
+        Resolve flags which are about to be looked up with a single batch call to
+        the provider. Their hooks run when they are first looked up. A flag looked
+        up with another default value than the prefetched one is resolved again,
+        and a failing prefetch is logged and ignored, the flags are then resolved
+        one by one.
+
+        Nothing is prefetched while the client has before hooks, since the context
+        they return must be part of the evaluation.
+
+        :param flags: the (flag type, key, default value) of each flag
+        """
+        if self.client._stage_hooks[HookType.BEFORE]:
+            return
+        flags = [
+            flag
+            for flag in flags
+            if (flag[1], flag[0]) not in self._details
+            and (flag[1], flag[0]) not in self._prefetched
+        ]
+        if not flags:
+            return
+        try:
+            details = self.client.prefetch_flag_details(flags, self.evaluation_context)
+        except Exception:
+            logging.exception("Failed to prefetch %d flags", len(flags))
+            return
+        for (flag_type, key, default_value), flag_details in zip(flags, details):
+            self._prefetched[(key, flag_type)] = (default_value, flag_details)
+
+    def evaluated_flags(self) -> typing.List[typing.Tuple[FlagType, str, typing.Any]]:
+        """
+        :return: the (flag type, key, default value) of every flag looked up
+        through the session, in the order of their first lookup
+        """
+        return [
+            (flag_type, key, default_value)
+            for (key, flag_type), default_value in self._defaults.items()
+        ]
+
+    def clear(self):
+        """
+        Drop every memoized evaluation so the next lookups hit the client again.
+        """
+        self._details.clear()
+        self._prefetched.clear()
@@ -0,0 +1,250 @@
+import threading
+import time
+import typing
+from collections import deque
+from enum import Enum
+from numbers import Number
+
+from open_feature.evaluation_context.evaluation_context import EvaluationContext
+from open_feature.exception.exceptions import OpenFeatureError
+from open_feature.flag_evaluation.error_code import ErrorCode
+from open_feature.flag_evaluation.flag_evaluation_details import FlagEvaluationDetails
+from open_feature.flag_evaluation.flag_type import FlagType
+from open_feature.flag_evaluation.reason import Reason
+from open_feature.provider.provider import AbstractProvider
+
+# error codes which reflect a failing backend rather than an expected outcome
+# such as a missing flag
+_FAILURE_ERROR_CODES = {ErrorCode.GENERAL, ErrorCode.PROVIDER_NOT_READY}
+
+
+class CircuitState(Enum):
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+
+class CircuitBreakerProvider(AbstractProvider):
+    """
+    Wraps a provider and stops calling it while it is failing, so evaluations fail
+    fast instead of waiting on a degraded backend.
+
+    Calls are CLOSED (passed through) until, over the last window_size calls, the
+    share of failures reaches failure_rate_threshold. A failure is details, or a
+    raised OpenFeatureError, with a GENERAL or PROVIDER_NOT_READY error code, any
+    other raised exception, or a call slower than slow_call_threshold. The circuit
+    then OPENs: evaluations are answered with the last known good details of the
+    flag (reason CACHED), or the default value with a GENERAL error code. After
+    open_duration a single HALF_OPEN probe is let through, closing the circuit on
+    success or opening it again on failure. Calls which were already in flight
+    when the circuit opened are not counted.
+
+    The last known good details are kept per flag, not per evaluation context:
+    while the circuit is open, every caller is served the value last resolved for
+    the flag, whichever context it was targeted at.
+    """
+
+    def __init__(
+        self,
+        provider: AbstractProvider,
+        failure_rate_threshold: float = 0.5,
+        slow_call_threshold: float = None,
+        window_size: int = 20,
+        minimum_calls: int = 10,
+        open_duration: float = 30.0,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param provider: the wrapped provider
+        :param failure_rate_threshold: share of failed calls, between 0 and 1,
+        which opens the circuit
+        :param slow_call_threshold: duration in seconds above which a call counts
+        as failed, None to ignore latency
+        :param window_size: the number of most recent calls the rate is computed on
+        :param minimum_calls: the number of calls needed before the circuit can open
+        :param open_duration: seconds the circuit stays open before a probe
+        :param clock: monotonic time source in seconds
+        """
+        self.provider = provider
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_threshold = slow_call_threshold
+        self.minimum_calls = minimum_calls
+        self.open_duration = open_duration
+        self.clock = clock
+        self.state = CircuitState.CLOSED
+
+        self._calls: typing.Deque[bool] = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._probing = False
+        self._last_known_good: typing.Dict[
+            typing.Tuple[FlagType, str], FlagEvaluationDetails
+        ] = {}
+        self._lock = threading.Lock()
+
+    def get_name(self) -> str:
+        return self.provider.get_name()
+
+    def add_flag_change_listener(
+        self, listener: typing.Callable[[typing.FrozenSet[str]], None]
+    ):
+        # flag changes are emitted by the wrapped provider
+        self.provider.add_flag_change_listener(listener)
+
+    def remove_flag_change_listener(
+        self, listener: typing.Callable[[typing.FrozenSet[str]], None]
+    ):
+        self.provider.remove_flag_change_listener(listener)
+
+    def get_boolean_details(
+        self,
+        key: str,
+        default_value: bool,
+        evaluation_context: EvaluationContext = None,
+    ):
+        return self._evaluate(
+            FlagType.BOOLEAN,
+            self.provider.get_boolean_details,
+            key,
+            default_value,
+            evaluation_context,
+        )
+
+    def get_string_details(
+        self,
+        key: str,
+        default_value: str,
+        evaluation_context: EvaluationContext = None,
+    ):
+        return self._evaluate(
+            FlagType.STRING,
+            self.provider.get_string_details,
+            key,
+            default_value,
+            evaluation_context,
+        )
+
+    def get_number_details(
+        self,
+        key: str,
+        default_value: Number,
+        evaluation_context: EvaluationContext = None,
+    ):
+        return self._evaluate(
+            FlagType.NUMBER,
+            self.provider.get_number_details,
+            key,
+            default_value,
+            evaluation_context,
+        )
+
+    def get_object_details(
+        self,
+        key: str,
+        default_value: dict,
+        evaluation_context: EvaluationContext = None,
+    ):
+        return self._evaluate(
+            FlagType.OBJECT,
+            self.provider.get_object_details,
+            key,
+            default_value,
+            evaluation_context,
+        )
+
+    def _evaluate(
+        self,
+        flag_type: FlagType,
+        get_details: typing.Callable[..., FlagEvaluationDetails],
+        key: str,
+        default_value: typing.Any,
+        evaluation_context: EvaluationContext = None,
+    ) -> FlagEvaluationDetails:
+        allowed, probe = self._allow_call()
+        if not allowed:
+            return self._fallback(flag_type, key, default_value)
+
+        start = self.clock()
+        try:
+            details = get_details(key, default_value, evaluation_context)
+        except OpenFeatureError as e:
+            # expected outcomes such as a missing flag may still be raised
+            error_code = e.error_code or ErrorCode.GENERAL
+            self._record(failed=error_code in _FAILURE_ERROR_CODES, probe=probe)
+            raise
+        except Exception:
+            self._record(failed=True, probe=probe)
+            raise
+
+        slow = (
+            self.slow_call_threshold is not None
+            and self.clock() - start > self.slow_call_threshold
+        )
+        failed = slow or details.error_code in _FAILURE_ERROR_CODES
+        self._record(failed=failed, probe=probe)
+        if details.error_code is None:
+            self._last_known_good[(flag_type, key)] = details
+        return details
+
+    def _allow_call(self) -> typing.Tuple[bool, bool]:
+        """
+        :return: whether the call may go through, and whether it is the half-open
+        probe
+        """
+        if self.state is CircuitState.CLOSED:
+            return True, False
+        with self._lock:
+            if self.state is CircuitState.CLOSED:
+                return True, False
+            if self.state is CircuitState.OPEN:
+                if self.clock() - self._opened_at < self.open_duration:
+                    return False, False
+                self.state = CircuitState.HALF_OPEN
+            if self._probing:
+                return False, False
+            self._probing = True
+            return True, True
+
+    def _record(self, failed: bool, probe: bool):
+        with self._lock:
+            if probe:
+                self._probing = False
+                if failed:
+                    self._open()
+                else:
+                    self.state = CircuitState.CLOSED
+                    self._calls.clear()
+                return
+
+            # calls which started before the circuit opened do not count
+            if self.state is not CircuitState.CLOSED:
+                return
+            self._calls.append(failed)
+            if (
+                len(self._calls) >= self.minimum_calls
+                and sum(self._calls) / len(self._calls) >= self.failure_rate_threshold
+            ):
+                self._open()
+
+    def _open(self):
+        self.state = CircuitState.OPEN
+        self._opened_at = self.clock()
+        self._calls.clear()
+
+    def _fallback(
+        self, flag_type: FlagType, key: str, default_value: typing.Any
+    ) -> FlagEvaluationDetails:
+        last_known_good = self._last_known_good.get((flag_type, key))
+        if last_known_good is not None:
+            return FlagEvaluationDetails(
+                key=key,
+                value=last_known_good.value,
+                reason=Reason.CACHED,
+                variant=last_known_good.variant,
+            )
+        return FlagEvaluationDetails(
+            key=key,
+            value=default_value,
+            reason=Reason.ERROR,
+            error_code=ErrorCode.GENERAL,
+            error_message=f"Circuit open for provider {self.provider.get_name()}",
+        )
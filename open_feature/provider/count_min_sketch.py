@@ -0,0 +1,67 @@
+import typing
+
+
+class CountMinSketch:
+    """
+    Approximate frequency counter in constant memory. Estimates never undercount,
+    and overcount only through hash collisions, which stay rare while the width is
+    large compared to the number of frequently counted items.
+
+    Counters are halved every sample_size additions, so that the estimates follow
+    recent traffic and items which stopped being counted fade away.
+    """
+
+    def __init__(self, width: int = 4096, depth: int = 4, sample_size: int = None):
+        """
+        :param width: the number of counters per row
+        :param depth: the number of rows, each item is counted once per row
+        :param sample_size: the number of additions between two agings, ten times
+        the width by default
+        """
+        self.width = width
+        self.depth = depth
+        self.sample_size = sample_size or 10 * width
+        self._rows = [[0] * width for _ in range(depth)]
+        self._additions = 0
+
+    def add(self, item: typing.Hashable) -> int:
+        """
+        Count one occurrence of the item.
+
+        :param item: the item to count
+        :return: the estimated count of the item, including this occurrence
+        """
+        indexes = self._indexes(item)
+        # conservative update: only the smallest counters are incremented, which
+        # reduces the overcounting caused by collisions
+        estimate = min(row[index] for row, index in zip(self._rows, indexes)) + 1
+        for row, index in zip(self._rows, indexes):
+            if row[index] < estimate:
+                row[index] = estimate
+
+        self._additions += 1
+        if self._additions >= self.sample_size:
+            self.age()
+        return estimate
+
+    def estimate(self, item: typing.Hashable) -> int:
+        """
+        :param item: the item to look up
+        :return: the estimated count of the item
+        """
+        return min(row[index] for row, index in zip(self._rows, self._indexes(item)))
+
+    def age(self):
+        """
+        Halve every counter.
+        """
+        for row in self._rows:
+            row[:] = [count >> 1 for count in row]
+        self._additions //= 2
+
+    def _indexes(self, item: typing.Hashable) -> typing.List[int]:
+        # derive the index of every row from a single hash (double hashing)
+        item_hash = hash(item)
+        first = item_hash & 0xFFFFFFFF
+        second = ((item_hash >> 32) & 0xFFFFFFFF) | 1
+        return [(first + row * second) % self.width for row in range(self.depth)]
@@ -0,0 +1,161 @@
+import typing
+
+from open_feature.evaluation_context.evaluation_context import EvaluationContext
+from open_feature.flag_evaluation.reason import Reason
+from open_feature.provider.in_memory.in_memory_flag import (
+    SEGMENT_OPERATORS,
+    TARGETING_KEY,
+    Condition,
+    InMemoryFlag,
+    Operator,
+    TargetingRule,
+)
+from open_feature.provider.segment_store import SegmentStore
+
+# 32 bit FNV-1a parameters, kept simple so the batch evaluator can reproduce the
+# exact same split buckets column-wise
+FNV_OFFSET_BASIS = 0x811C9DC5
+FNV_PRIME = 0x01000193
+
+_MISSING = object()
+
+COMPARATORS = {
+    Operator.EQUALS: lambda a, b: a == b,
+    Operator.NOT_EQUALS: lambda a, b: a != b,
+    Operator.IN: lambda a, b: a in b,
+    Operator.NOT_IN: lambda a, b: a not in b,
+    Operator.GREATER_THAN: lambda a, b: a > b,
+    Operator.GREATER_THAN_OR_EQUAL: lambda a, b: a >= b,
+    Operator.LESS_THAN: lambda a, b: a < b,
+    Operator.LESS_THAN_OR_EQUAL: lambda a, b: a <= b,
+}
+
+
+def fnv1a(data: bytes, seed: int = FNV_OFFSET_BASIS) -> int:
+    """
+    Hash bytes with 32 bit FNV-1a, starting from the given intermediate state.
+
+    :param data: the bytes to hash
+    :param seed: the hash state to start from
+    :return: the 32 bit hash
+    """
+    h = seed
+    for byte in data:
+        h = ((h ^ byte) * FNV_PRIME) & 0xFFFFFFFF
+    return h
+
+
+def split_seed(flag_key: str) -> int:
+    """
+    Hash state after the flag key, shared by every targeting key of the flag so
+    that each flag distributes users independently.
+    """
+    return fnv1a(flag_key.encode("utf-8") + b".")
+
+
+def split_variant(
+    flag_key: str, split: typing.Dict[str, int], targeting_key: str
+) -> typing.Optional[str]:
+    """
+    Pick the variant of a percentage split for a targeting key.
+
+    :param flag_key: the string key of the flag
+    :param split: the weight of each variant
+    :param targeting_key: the targeting key of the evaluation context
+    :return: the selected variant, or None if the split has no weight
+    """
+    total = sum(split.values())
+    if total <= 0:
+        return None
+    bucket = fnv1a(targeting_key.encode("utf-8"), split_seed(flag_key)) % total
+    cumulative = 0
+    for variant, weight in split.items():
+        cumulative += weight
+        if bucket < cumulative:
+            return variant
+    return None
+
+
+def attribute_value(evaluation_context: EvaluationContext, attribute: str):
+    if attribute == TARGETING_KEY:
+        return evaluation_context.targeting_key or _MISSING
+    return evaluation_context.attributes.get(attribute, _MISSING)
+
+
+def condition_matches(
+    condition: Condition,
+    evaluation_context: EvaluationContext,
+    segments: SegmentStore = None,
+) -> bool:
+    value = attribute_value(evaluation_context, condition.attribute)
+    if value is _MISSING or value is None:
+        return False
+    if condition.operator in SEGMENT_OPERATORS:
+        return segment_condition_matches(condition, value, segments)
+    try:
+        return bool(COMPARATORS[condition.operator](value, condition.value))
+    except TypeError:
+        # incomparable types, e.g. a numeric condition on a string attribute
+        return False
+
+
+def segment_condition_matches(
+    condition: Condition, value: typing.Any, segments: SegmentStore = None
+) -> bool:
+    if segments is None or not isinstance(value, str):
+        return False
+    contains = segments.contains(condition.value, value)
+    if contains is None:
+        return False
+    return contains is (condition.operator is Operator.IN_SEGMENT)
+
+
+def match_rule(
+    rules: typing.List[TargetingRule],
+    evaluation_context: EvaluationContext,
+    segments: SegmentStore = None,
+) -> typing.Optional[TargetingRule]:
+    for rule in rules:
+        if all(
+            condition_matches(condition, evaluation_context, segments)
+            for condition in rule.conditions
+        ):
+            return rule
+    return None
+
+
+def evaluate_flag(
+    flag_key: str,
+    flag: InMemoryFlag,
+    evaluation_context: EvaluationContext,
+    match: typing.Callable[[EvaluationContext], TargetingRule] = None,
+    segments: SegmentStore = None,
+) -> typing.Tuple[typing.Optional[str], Reason]:
+    """
+    Resolve the variant an InMemoryFlag serves to an evaluation context.
+
+    :param flag_key: the string key of the flag
+    :param flag: the flag definition
+    :param evaluation_context: Information for the purposes of flag evaluation
+    :param match: finds the first targeting rule of the flag matching a context,
+    such as RuleIndex.match, defaults to checking every rule in order
+    :param segments: the segments referred to by segment conditions
+    :return: the selected variant, None when the flag is disabled, and the reason
+    for the selection
+    """
+    if not flag.enabled:
+        return None, Reason.DISABLED
+
+    if match is None:
+        rule = match_rule(flag.rules, evaluation_context, segments)
+    else:
+        rule = match(evaluation_context)
+    if rule is not None:
+        return rule.variant, Reason.TARGETING_MATCH
+
+    if flag.split and evaluation_context.targeting_key:
+        variant = split_variant(flag_key, flag.split, evaluation_context.targeting_key)
+        if variant is not None:
+            return variant, Reason.SPLIT
+
+    return flag.default_variant, Reason.DEFAULT
@@ -0,0 +1,306 @@
+"""
+Compact binary snapshot of InMemoryFlag definitions, loaded lazily from a memory
+mapped file so that a worker only decodes the flags it actually evaluates.
+
+Layout, little endian:
+
+    header      magic "OFSN", format version u16, reserved u16,
+                flag count u32, string count u32,
+                string table offset u64, index offset u64
+    strings     (string count + 1) u64 offsets relative to the blob, utf-8 blob
+    flags       one record per flag, see _write_flag
+    index       (key string id u32, record offset u64) per flag, sorted by key
+
+Every string (flag keys, variant names, attribute names and JSON encoded values)
+is stored once in the string table and referenced by id. Targeting rules are
+precompiled into fixed size (opcode u8, attribute id u32, value id u32) records.
+"""
+import bisect
+import json
+import mmap
+import os
+import struct
+import threading
+import typing
+from collections.abc import Mapping, Sequence
+
+from open_feature.exception.exceptions import ParseError
+from open_feature.provider.in_memory.in_memory_flag import (
+    Condition,
+    InMemoryFlag,
+    Operator,
+    TargetingRule,
+)
+
+MAGIC = b"OFSN"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<4sHHIIQQ")
+_OFFSET = struct.Struct("<Q")
+_INDEX_ENTRY = struct.Struct("<IQ")
+_FLAG_HEADER = struct.Struct("<BIH")
+_COUNT = struct.Struct("<H")
+_VARIANT = struct.Struct("<II")
+_RULE_HEADER = struct.Struct("<IH")
+_CONDITION = struct.Struct("<BII")
+_SPLIT_ENTRY = struct.Struct("<II")
+
+# opcodes are part of the file format, never renumber them
+_OPCODES = {
+    Operator.EQUALS: 1,
+    Operator.NOT_EQUALS: 2,
+    Operator.IN: 3,
+    Operator.NOT_IN: 4,
+    Operator.GREATER_THAN: 5,
+    Operator.GREATER_THAN_OR_EQUAL: 6,
+    Operator.LESS_THAN: 7,
+    Operator.LESS_THAN_OR_EQUAL: 8,
+    Operator.IN_SEGMENT: 9,
+    Operator.NOT_IN_SEGMENT: 10,
+}
+_OPERATORS = {opcode: operator for operator, opcode in _OPCODES.items()}
+
+_ENABLED = 0x01
+
+
+def write_flag_snapshot(flags: typing.Mapping[str, InMemoryFlag], path: str):
+    """
+    Write flag definitions to a binary snapshot file. The file is written next to
+    its destination and moved into place, so readers never see a partial file.
+
+    :param flags: the flag definitions by flag key
+    :param path: the destination file
+    """
+    strings = _StringTable()
+    keys = sorted(flags)
+    key_ids = [strings.add(key) for key in keys]
+
+    records = bytearray()
+    record_offsets = []
+    for key in keys:
+        record_offsets.append(len(records))
+        _write_flag(records, flags[key], strings)
+
+    blob = bytearray()
+    string_offsets = bytearray()
+    for value in strings.values:
+        string_offsets += _OFFSET.pack(len(blob))
+        blob += value.encode("utf-8")
+    string_offsets += _OFFSET.pack(len(blob))
+
+    strings_offset = _HEADER.size
+    records_offset = strings_offset + len(string_offsets) + len(blob)
+    index_offset = records_offset + len(records)
+
+    # index entries are sorted by key, as keys was
+    index = bytearray()
+    for key_id, record_offset in zip(key_ids, record_offsets):
+        index += _INDEX_ENTRY.pack(key_id, records_offset + record_offset)
+
+    header = _HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        0,
+        len(keys),
+        len(strings.values),
+        strings_offset,
+        index_offset,
+    )
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as file:
+        for chunk in (header, string_offsets, blob, records, index):
+            file.write(chunk)
+    os.replace(tmp_path, path)
+
+
+class FlagSnapshot(Mapping):
+    """
+    Read-only mapping of flag key to InMemoryFlag backed by a memory mapped
+    snapshot file. Flags are decoded on first access and kept afterwards, so it
+    can be handed directly to an InMemoryProvider or any local provider.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: a file written by write_flag_snapshot
+        """
+        with open(path, "rb") as file:
+            self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._buffer) < _HEADER.size:
+            raise ParseError(error_message=f"'{path}' is not a flag snapshot")
+        (
+            magic,
+            version,
+            _,
+            self._flag_count,
+            self._string_count,
+            strings_offset,
+            self._index_offset,
+        ) = _HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC:
+            raise ParseError(error_message=f"'{path}' is not a flag snapshot")
+        if version != FORMAT_VERSION:
+            raise ParseError(
+                error_message=f"Unsupported flag snapshot format version {version}"
+            )
+
+        self._string_offsets = strings_offset
+        self._blob_offset = strings_offset + (self._string_count + 1) * _OFFSET.size
+        self._keys = _IndexKeys(self)
+        self._flags: typing.Dict[str, InMemoryFlag] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key: str) -> InMemoryFlag:
+        flag = self._flags.get(key)
+        if flag is not None:
+            return flag
+
+        position = bisect.bisect_left(self._keys, key)
+        if position == self._flag_count or self._keys[position] != key:
+            raise KeyError(key)
+
+        _, record_offset = _INDEX_ENTRY.unpack_from(
+            self._buffer, self._index_offset + position * _INDEX_ENTRY.size
+        )
+        flag = self._read_flag(record_offset)
+        with self._lock:
+            return self._flags.setdefault(key, flag)
+
+    def __len__(self) -> int:
+        return self._flag_count
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return (self._keys[position] for position in range(self._flag_count))
+
+    def close(self):
+        self._buffer.close()
+
+    def __enter__(self) -> "FlagSnapshot":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _string(self, string_id: int) -> str:
+        start, end = struct.unpack_from(
+            "<QQ", self._buffer, self._string_offsets + string_id * _OFFSET.size
+        )
+        start += self._blob_offset
+        end += self._blob_offset
+        return self._buffer[start:end].decode("utf-8")
+
+    def _value(self, string_id: int) -> typing.Any:
+        return json.loads(self._string(string_id))
+
+    def _read_flag(self, offset: int) -> InMemoryFlag:
+        buffer = self._buffer
+        options, default_variant_id, variant_count = _FLAG_HEADER.unpack_from(
+            buffer, offset
+        )
+        offset += _FLAG_HEADER.size
+
+        variants = {}
+        for _ in range(variant_count):
+            name_id, value_id = _VARIANT.unpack_from(buffer, offset)
+            offset += _VARIANT.size
+            variants[self._string(name_id)] = self._value(value_id)
+
+        (rule_count,) = _COUNT.unpack_from(buffer, offset)
+        offset += _COUNT.size
+        rules = []
+        for _ in range(rule_count):
+            variant_id, condition_count = _RULE_HEADER.unpack_from(buffer, offset)
+            offset += _RULE_HEADER.size
+            conditions = []
+            for _ in range(condition_count):
+                opcode, attribute_id, value_id = _CONDITION.unpack_from(buffer, offset)
+                offset += _CONDITION.size
+                operator = _OPERATORS.get(opcode)
+                if operator is None:
+                    raise ParseError(error_message=f"Unknown rule opcode {opcode}")
+                conditions.append(
+                    Condition(
+                        self._string(attribute_id), operator, self._value(value_id)
+                    )
+                )
+            rules.append(TargetingRule(self._string(variant_id), conditions))
+
+        (split_count,) = _COUNT.unpack_from(buffer, offset)
+        offset += _COUNT.size
+        split = {}
+        for _ in range(split_count):
+            variant_id, weight = _SPLIT_ENTRY.unpack_from(buffer, offset)
+            offset += _SPLIT_ENTRY.size
+            split[self._string(variant_id)] = weight
+
+        return InMemoryFlag(
+            variants=variants,
+            default_variant=self._string(default_variant_id),
+            rules=rules,
+            split=split or None,
+            enabled=bool(options & _ENABLED),
+        )
+
+
+class _IndexKeys(Sequence):
+    """
+    Sorted flag keys of a snapshot, decoded on demand for binary searches.
+    """
+
+    def __init__(self, snapshot: FlagSnapshot):
+        self._snapshot = snapshot
+
+    def __len__(self) -> int:
+        return self._snapshot._flag_count
+
+    def __getitem__(self, position: int) -> str:
+        snapshot = self._snapshot
+        key_id, _ = _INDEX_ENTRY.unpack_from(
+            snapshot._buffer, snapshot._index_offset + position * _INDEX_ENTRY.size
+        )
+        return snapshot._string(key_id)
+
+
+class _StringTable:
+    def __init__(self):
+        self.values: typing.List[str] = []
+        self._ids: typing.Dict[str, int] = {}
+
+    def add(self, value: str) -> int:
+        string_id = self._ids.get(value)
+        if string_id is None:
+            string_id = self._ids[value] = len(self.values)
+            self.values.append(value)
+        return string_id
+
+    def add_value(self, value: typing.Any) -> int:
+        if isinstance(value, (set, frozenset)):
+            value = sorted(value, key=repr)
+        return self.add(json.dumps(value, separators=(",", ":")))
+
+
+def _write_flag(records: bytearray, flag: InMemoryFlag, strings: _StringTable):
+    records += _FLAG_HEADER.pack(
+        _ENABLED if flag.enabled else 0,
+        strings.add(flag.default_variant),
+        len(flag.variants),
+    )
+    for name, value in flag.variants.items():
+        records += _VARIANT.pack(strings.add(name), strings.add_value(value))
+
+    records += _COUNT.pack(len(flag.rules))
+    for rule in flag.rules:
+        records += _RULE_HEADER.pack(strings.add(rule.variant), len(rule.conditions))
+        for condition in rule.conditions:
+            records += _CONDITION.pack(
+                _OPCODES[condition.operator],
+                strings.add(condition.attribute),
+                strings.add_value(condition.value),
+            )
+
+    split = flag.split or {}
+    records += _COUNT.pack(len(split))
+    for name, weight in split.items():
+        records += _SPLIT_ENTRY.pack(strings.add(name), weight)
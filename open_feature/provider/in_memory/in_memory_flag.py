@@ -0,0 +1,68 @@
+import typing
+from dataclasses import dataclass, field
+from enum import Enum
+
+# Name under which conditions refer to EvaluationContext.targeting_key
+TARGETING_KEY = "targeting_key"
+
+
+class Operator(Enum):
+    EQUALS = "EQUALS"
+    NOT_EQUALS = "NOT_EQUALS"
+    IN = "IN"
+    NOT_IN = "NOT_IN"
+    GREATER_THAN = "GREATER_THAN"
+    GREATER_THAN_OR_EQUAL = "GREATER_THAN_OR_EQUAL"
+    LESS_THAN = "LESS_THAN"
+    LESS_THAN_OR_EQUAL = "LESS_THAN_OR_EQUAL"
+    # the condition value is the name of a segment of a SegmentStore
+    IN_SEGMENT = "IN_SEGMENT"
+    NOT_IN_SEGMENT = "NOT_IN_SEGMENT"
+
+
+SEGMENT_OPERATORS = (Operator.IN_SEGMENT, Operator.NOT_IN_SEGMENT)
+
+
+@dataclass(frozen=True)
+class Condition:
+    """
+    A single test of an evaluation context attribute. A condition on an attribute
+    missing from the context, or on a segment unknown to the provider, never
+    matches.
+    """
+
+    attribute: str
+    operator: Operator
+    value: typing.Any
+
+    def __post_init__(self):
+        if self.operator in (Operator.IN, Operator.NOT_IN):
+            object.__setattr__(self, "value", frozenset(self.value))
+
+
+@dataclass
+class TargetingRule:
+    """
+    Serves its variant when every one of its conditions matches the context.
+    """
+
+    variant: str
+    conditions: typing.List[Condition] = field(default_factory=list)
+
+
+@dataclass
+class InMemoryFlag:
+    """
+    Definition of a flag evaluated locally by the InMemoryProvider.
+
+    A disabled flag resolves to the caller's default value. Otherwise the first
+    matching targeting rule wins, then, for contexts with a targeting key, the
+    percentage split picks a variant proportionally to its weight, and finally the
+    default variant is served.
+    """
+
+    variants: typing.Dict[str, typing.Any]
+    default_variant: str
+    rules: typing.List[TargetingRule] = field(default_factory=list)
+    split: typing.Dict[str, int] = None
+    enabled: bool = True
@@ -0,0 +1,254 @@
+import itertools
+import threading
+import typing
+from collections.abc import Mapping
+from numbers import Number
+
+from open_feature.evaluation_context.evaluation_context import EvaluationContext
+from open_feature.flag_evaluation.error_code import ErrorCode
+from open_feature.flag_evaluation.flag_evaluation_details import FlagEvaluationDetails
+from open_feature.flag_evaluation.flag_type import FlagType
+from open_feature.flag_evaluation.reason import Reason
+from open_feature.provider.in_memory.flag_evaluator import evaluate_flag
+from open_feature.provider.in_memory.in_memory_flag import InMemoryFlag
+from open_feature.provider.in_memory.rule_index import RuleIndex
+from open_feature.provider.object_value_cache import ObjectValueCache
+from open_feature.provider.provider import AbstractProvider
+from open_feature.provider.segment_store import SegmentStore
+
+_TYPE_CHECKS = {
+    FlagType.BOOLEAN: lambda value: isinstance(value, bool),
+    FlagType.STRING: lambda value: isinstance(value, str),
+    FlagType.NUMBER: lambda value: isinstance(value, Number)
+    and not isinstance(value, bool),
+    FlagType.OBJECT: lambda value: isinstance(value, (Mapping, str, bytes)),
+}
+
+# below this many targeting rules, checking them in order is cheaper than an index
+RULE_INDEX_MIN_RULES = 8
+
+
+class _FlagOverlay(Mapping):
+    """
+    Flag definitions updated on top of a lazily loaded mapping, so that updates
+    leave the flags of the base mapping undecoded. None marks a removed flag.
+    """
+
+    def __init__(
+        self,
+        changes: typing.Dict[str, typing.Optional[InMemoryFlag]],
+        base: typing.Mapping[str, InMemoryFlag],
+    ):
+        self.changes = changes
+        self.base = base
+
+    def __getitem__(self, key: str) -> InMemoryFlag:
+        if key in self.changes:
+            flag = self.changes[key]
+            if flag is None:
+                raise KeyError(key)
+            return flag
+        return self.base[key]
+
+    def __len__(self) -> int:
+        return len(self.base) + sum(
+            (flag is not None) - (key in self.base)
+            for key, flag in self.changes.items()
+        )
+
+    def __iter__(self) -> typing.Iterator[str]:
+        for key, flag in self.changes.items():
+            if flag is not None:
+                yield key
+        for key in self.base:
+            if key not in self.changes:
+                yield key
+
+
+class InMemoryProvider(AbstractProvider):
+    """
+    A provider evaluating InMemoryFlag definitions locally, without any remote
+    call. Object variants are served as shared read-only views, and flags with
+    many targeting rules are matched through a RuleIndex.
+    """
+
+    def __init__(
+        self,
+        flags: typing.Mapping[str, InMemoryFlag],
+        segments: SegmentStore = None,
+    ):
+        """
+        :param flags: the flag definitions by flag key, any mapping can be used
+        such as a lazily decoded snapshot
+        :param segments: the segments referred to by segment conditions
+        """
+        self._versions = itertools.count()
+        self._object_values = ObjectValueCache()
+        self.flags = flags
+        self.segments = segments
+        self._update_lock = threading.Lock()
+        self._rule_indexes: typing.Dict[
+            str, typing.Tuple[InMemoryFlag, typing.Optional[RuleIndex]]
+        ] = {}
+        if isinstance(flags, dict):
+            # lazily loaded mappings are indexed as their flags are first used
+            for key, flag in flags.items():
+                self._rule_index(key, flag)
+
+    @property
+    def flags(self) -> typing.Mapping[str, InMemoryFlag]:
+        return self._definitions[0]
+
+    @flags.setter
+    def flags(self, flags: typing.Mapping[str, InMemoryFlag]):
+        # the definitions are swapped together with the version of each flag, the
+        # cached object values of a flag are only shared within a version
+        self._definitions = (flags, {}, next(self._versions))
+        self._object_values.invalidate()
+
+    def get_name(self) -> str:
+        return "In-memory Provider"
+
+    def update_flags(self, flags: typing.Mapping[str, typing.Optional[InMemoryFlag]]):
+        """
+        Add, replace or remove flag definitions, and notify the flag change
+        listeners of the flags which actually changed. The flags are swapped in
+        as a whole, so concurrent evaluations see either the previous or the new
+        definitions. The changes to a lazily loaded mapping are overlaid on it,
+        so that its other flags stay undecoded.
+
+        :param flags: the new definitions by flag key, None removes the flag
+        """
+        with self._update_lock:
+            current, versions, base_version = self._definitions
+            changes = {
+                key: flag for key, flag in flags.items() if current.get(key) != flag
+            }
+            if not changes:
+                return
+            if isinstance(current, dict):
+                updated = {**current, **changes}
+                for key, flag in changes.items():
+                    if flag is None:
+                        del updated[key]
+            elif isinstance(current, _FlagOverlay):
+                updated = _FlagOverlay({**current.changes, **changes}, current.base)
+            else:
+                updated = _FlagOverlay(changes, current)
+            changed = set(changes)
+            version = next(self._versions)
+            versions = {**versions, **{key: version for key in changed}}
+            self._definitions = (updated, versions, base_version)
+            for key in changed:
+                self._object_values.invalidate(key)
+                self._rule_indexes.pop(key, None)
+                if key in updated:
+                    self._rule_index(key, updated[key])
+        self.emit_flag_changes(changed)
+
+    def get_boolean_details(
+        self,
+        key: str,
+        default_value: bool,
+        evaluation_context: EvaluationContext = None,
+    ):
+        return self._resolve(FlagType.BOOLEAN, key, default_value, evaluation_context)
+
+    def get_string_details(
+        self,
+        key: str,
+        default_value: str,
+        evaluation_context: EvaluationContext = None,
+    ):
+        return self._resolve(FlagType.STRING, key, default_value, evaluation_context)
+
+    def get_number_details(
+        self,
+        key: str,
+        default_value: Number,
+        evaluation_context: EvaluationContext = None,
+    ):
+        return self._resolve(FlagType.NUMBER, key, default_value, evaluation_context)
+
+    def get_object_details(
+        self,
+        key: str,
+        default_value: dict,
+        evaluation_context: EvaluationContext = None,
+    ):
+        return self._resolve(FlagType.OBJECT, key, default_value, evaluation_context)
+
+    def _resolve(
+        self,
+        flag_type: FlagType,
+        key: str,
+        default_value: typing.Any,
+        evaluation_context: EvaluationContext = None,
+    ) -> FlagEvaluationDetails:
+        flags, versions, base_version = self._definitions
+        flag = flags.get(key)
+        if flag is None:
+            return FlagEvaluationDetails(
+                key=key,
+                value=default_value,
+                reason=Reason.ERROR,
+                error_code=ErrorCode.FLAG_NOT_FOUND,
+                error_message=f"Flag '{key}' not found",
+            )
+
+        rule_index = self._rule_index(key, flag)
+        variant, reason = evaluate_flag(
+            key,
+            flag,
+            evaluation_context or EvaluationContext(),
+            rule_index.match if rule_index else None,
+            self.segments,
+        )
+        if variant is None:
+            return FlagEvaluationDetails(key=key, value=default_value, reason=reason)
+
+        if variant not in flag.variants:
+            return FlagEvaluationDetails(
+                key=key,
+                value=default_value,
+                reason=Reason.ERROR,
+                error_code=ErrorCode.GENERAL,
+                error_message=f"Flag '{key}' has no variant '{variant}'",
+            )
+
+        value = flag.variants[variant]
+        if not _TYPE_CHECKS[flag_type](value):
+            return FlagEvaluationDetails(
+                key=key,
+                value=default_value,
+                reason=Reason.ERROR,
+                error_code=ErrorCode.TYPE_MISMATCH,
+                error_message=f"Flag '{key}' is not of type {flag_type.name}",
+            )
+
+        if flag_type is FlagType.OBJECT:
+            version = versions.get(key, base_version)
+            try:
+                value = self._object_values.get(key, variant, value, version=version)
+            except ValueError as e:
+                # JSON encoded variants are only decoded on first use
+                return FlagEvaluationDetails(
+                    key=key,
+                    value=default_value,
+                    reason=Reason.ERROR,
+                    error_code=ErrorCode.PARSE_ERROR,
+                    error_message=f"Flag '{key}' variant '{variant}' is not JSON: {e}",
+                )
+
+        return FlagEvaluationDetails(
+            key=key, value=value, reason=reason, variant=variant
+        )
+
+    def _rule_index(self, key: str, flag: InMemoryFlag) -> typing.Optional[RuleIndex]:
+        indexed = self._rule_indexes.get(key)
+        if indexed is None or indexed[0] is not flag:
+            rule_index = None
+            if len(flag.rules) >= RULE_INDEX_MIN_RULES:
+                rule_index = RuleIndex(flag.rules, self.segments)
+            indexed = self._rule_indexes[key] = (flag, rule_index)
+        return indexed[1]
@@ -0,0 +1,182 @@
+import bisect
+import typing
+from numbers import Number, Real
+
+from open_feature.evaluation_context.evaluation_context import EvaluationContext
+from open_feature.provider.in_memory.flag_evaluator import (
+    attribute_value,
+    match_rule,
+)
+from open_feature.provider.in_memory.in_memory_flag import (
+    Condition,
+    Operator,
+    TargetingRule,
+)
+from open_feature.provider.segment_store import SegmentStore
+
+_RANGE_OPERATORS = (
+    Operator.GREATER_THAN,
+    Operator.GREATER_THAN_OR_EQUAL,
+    Operator.LESS_THAN,
+    Operator.LESS_THAN_OR_EQUAL,
+)
+
+
+class _RangeIndex:
+    """
+    Rules anchored on one (attribute, comparison operator), sorted by threshold.
+    """
+
+    def __init__(self, operator: Operator):
+        self.operator = operator
+        self.thresholds: typing.List[Real] = []
+        self.rule_ids: typing.List[int] = []
+
+    def add(self, threshold: Real, rule_id: int):
+        position = bisect.bisect_right(self.thresholds, threshold)
+        self.thresholds.insert(position, threshold)
+        self.rule_ids.insert(position, rule_id)
+
+    def candidates(self, value: Real) -> typing.List[int]:
+        operator = self.operator
+        if operator is Operator.GREATER_THAN:
+            return self.rule_ids[: bisect.bisect_left(self.thresholds, value)]
+        if operator is Operator.GREATER_THAN_OR_EQUAL:
+            return self.rule_ids[: bisect.bisect_right(self.thresholds, value)]
+        if operator is Operator.LESS_THAN:
+            start = bisect.bisect_right(self.thresholds, value)
+        else:
+            start = bisect.bisect_left(self.thresholds, value)
+        return self.rule_ids[start:]
+
+
+class RuleIndex:
+    """
+    Inverted index over the targeting rules of a flag, built once when the flag is
+    loaded. Each rule is indexed on one of its conditions: equality and set
+    membership conditions by (attribute, value), numeric comparisons in a sorted
+    array of thresholds per (attribute, operator). Evaluating a context only checks
+    the rules its attribute values select, plus the rules with no indexable
+    condition, so the cost stays sub-linear in the number of rules.
+    """
+
+    def __init__(
+        self, rules: typing.List[TargetingRule], segments: SegmentStore = None
+    ):
+        """
+        :param rules: the targeting rules of a flag
+        :param segments: the segments referred to by segment conditions
+        """
+        self.rules = rules
+        self.segments = segments
+        self._values: typing.Dict[str, typing.Dict[typing.Any, typing.List[int]]] = {}
+        self._ranges: typing.Dict[str, typing.List[_RangeIndex]] = {}
+        self._unindexed: typing.List[int] = []
+
+        for rule_id, rule in enumerate(rules):
+            anchor = _anchor(rule)
+            if anchor is None:
+                self._unindexed.append(rule_id)
+            elif anchor.operator is Operator.EQUALS:
+                self._add_values(anchor.attribute, [anchor.value], rule_id)
+            elif anchor.operator is Operator.IN:
+                self._add_values(anchor.attribute, anchor.value, rule_id)
+            else:
+                self._range(anchor.attribute, anchor.operator).add(
+                    anchor.value, rule_id
+                )
+
+    def match(
+        self, evaluation_context: EvaluationContext
+    ) -> typing.Optional[TargetingRule]:
+        """
+        Find the first rule, in definition order, matching the context.
+
+        :param evaluation_context: Information for the purposes of flag evaluation
+        :return: the matching rule, or None
+        """
+        candidates = sorted(self.candidates(evaluation_context))
+        rules = [self.rules[i] for i in candidates]
+        return match_rule(rules, evaluation_context, self.segments)
+
+    def candidates(self, evaluation_context: EvaluationContext) -> typing.Set[int]:
+        """
+        :param evaluation_context: Information for the purposes of flag evaluation
+        :return: the ids of the rules which may match the context
+        """
+        candidates = set(self._unindexed)
+        for attribute, rules_by_value in self._values.items():
+            value = attribute_value(evaluation_context, attribute)
+            try:
+                candidates.update(rules_by_value.get(value, ()))
+            except TypeError:
+                # unhashable attribute value, it cannot equal an indexed value
+                pass
+        for attribute, range_indexes in self._ranges.items():
+            value = attribute_value(evaluation_context, attribute)
+            # missing, None and non-numeric values never compare with thresholds
+            if not isinstance(value, Number):
+                continue
+            for range_index in range_indexes:
+                # bools compare as numbers in evaluate_flag, NaN never matches
+                if isinstance(value, Real):
+                    if value == value:
+                        candidates.update(range_index.candidates(value))
+                else:
+                    # other numbers such as Decimal may still compare with the
+                    # thresholds, leave it to the conditions to decide
+                    candidates.update(range_index.rule_ids)
+        return candidates
+
+    def _add_values(self, attribute: str, values: typing.Iterable, rule_id: int):
+        rules_by_value = self._values.setdefault(attribute, {})
+        for value in values:
+            rule_ids = rules_by_value.setdefault(value, [])
+            if rule_id not in rule_ids:
+                rule_ids.append(rule_id)
+
+    def _range(self, attribute: str, operator: Operator) -> _RangeIndex:
+        range_indexes = self._ranges.setdefault(attribute, [])
+        for range_index in range_indexes:
+            if range_index.operator is operator:
+                return range_index
+        range_index = _RangeIndex(operator)
+        range_indexes.append(range_index)
+        return range_index
+
+
+def _anchor(rule: TargetingRule) -> typing.Optional[Condition]:
+    """
+    Pick the most selective indexable condition of a rule: an equality, then the
+    smallest set membership, then a numeric comparison.
+    """
+    best = None
+    best_rank = None
+    for condition in rule.conditions:
+        rank = _rank(condition)
+        if rank is not None and (best_rank is None or rank < best_rank):
+            best, best_rank = condition, rank
+    return best
+
+
+def _rank(condition: Condition) -> typing.Optional[tuple]:
+    operator = condition.operator
+    if operator is Operator.EQUALS and _is_hashable(condition.value):
+        return (0, 1)
+    if operator is Operator.IN:
+        return (1, len(condition.value))
+    if operator in _RANGE_OPERATORS and _is_number(condition.value):
+        return (2, 0)
+    return None
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, Real) and not isinstance(value, bool) and value == value
+
+
+def _is_hashable(value) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
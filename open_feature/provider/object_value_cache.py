@@ -0,0 +1,71 @@
+import json
+import threading
+import typing
+
+from open_feature.flag_evaluation.immutable_value import freeze
+
+_MISSING = object()
+
+
+class ObjectValueCache:
+    """
+    Holds the decoded, read-only value of every object flag variant a provider has
+    served. A variant is decoded from JSON and frozen once per flag version, then
+    the same immutable view is shared by every evaluation, so providers neither
+    copy large payloads per evaluation nor risk callers corrupting shared state.
+    """
+
+    def __init__(self, max_size: int = None):
+        """
+        :param max_size: optional bound on the number of cached variants, the
+        oldest entries are dropped first once it is reached
+        """
+        self.max_size = max_size
+        self._values: typing.Dict[tuple, typing.Any] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        key: str,
+        variant: str,
+        value: typing.Any,
+        version: typing.Hashable,
+    ) -> typing.Any:
+        """
+        Return the frozen value of a flag variant, building it on first use.
+
+        :param key: the string key of the flag
+        :param variant: the variant the value belongs to
+        :param value: the raw variant value, either already decoded or a JSON
+        encoded str or bytes
+        :param version: identifies the flag configuration the value comes from,
+        it must change whenever the raw value does, a new version builds a new
+        value
+        :return: a deeply immutable view of the value
+        """
+        cache_key = (key, variant, version)
+        frozen = self._values.get(cache_key, _MISSING)
+        if frozen is not _MISSING:
+            return frozen
+
+        if isinstance(value, (str, bytes, bytearray)):
+            value = json.loads(value)
+        frozen = freeze(value)
+
+        with self._lock:
+            if self.max_size is not None and len(self._values) >= self.max_size:
+                self._values.pop(next(iter(self._values)), None)
+            return self._values.setdefault(cache_key, frozen)
+
+    def invalidate(self, key: str = None):
+        """
+        Drop the cached values of a flag, or of every flag if no key is given.
+
+        :param key: the string key of the flag to drop
+        """
+        with self._lock:
+            if key is None:
+                self._values.clear()
+            else:
+                for cache_key in [k for k in self._values if k[0] == key]:
+                    del self._values[cache_key]
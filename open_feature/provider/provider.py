@@ -1,10 +1,32 @@
+import logging
+import threading
+import typing
 from abc import abstractmethod
 from numbers import Number
 
 from open_feature.evaluation_context.evaluation_context import EvaluationContext
+from open_feature.exception.exceptions import OpenFeatureError
+from open_feature.flag_evaluation.error_code import ErrorCode
+from open_feature.flag_evaluation.flag_evaluation_details import FlagEvaluationDetails
+from open_feature.flag_evaluation.flag_type import FlagType
+from open_feature.flag_evaluation.reason import Reason
 
 
 class AbstractProvider:
+    """
+    Base class for flag providers. A provider reports a failed evaluation either by
+    raising an OpenFeatureError subclass or, without the cost of an exception, by
+    returning a FlagEvaluationDetails with its error_code (and optionally
+    error_message) set. In both cases the client answers with the default value.
+
+    Providers whose flag definitions can change call emit_flag_changes with the
+    keys of the changed flags, so that clients can notify their subscribers.
+    """
+
+    # guards the registration of flag change listeners of every provider, which
+    # is rare enough not to warrant a lock per instance
+    _flag_change_lock = threading.Lock()
+
     @abstractmethod
     def get_name(self) -> str:
         pass
@@ -44,3 +66,89 @@ class AbstractProvider:
         evaluation_context: EvaluationContext = EvaluationContext(),
     ):
         pass
+
+    def get_details_batch(
+        self,
+        flags: typing.List[typing.Tuple[FlagType, str, typing.Any]],
+        evaluation_context: EvaluationContext = EvaluationContext(),
+    ) -> typing.List[FlagEvaluationDetails]:
+        """
+        Resolve several flags for the same evaluation context. Providers backed by
+        a remote service should override it to fetch every flag in a single round
+        trip, by default the flags are resolved one by one. A flag which fails to
+        resolve is reported by error-bearing details, without failing the others.
+
+        :param flags: the (flag type, key, default value) of each flag
+        :param evaluation_context: Information for the purposes of flag evaluation
+        :return: the FlagEvaluationDetails of each flag, in the order requested
+        """
+        get_details = {
+            FlagType.BOOLEAN: self.get_boolean_details,
+            FlagType.STRING: self.get_string_details,
+            FlagType.NUMBER: self.get_number_details,
+            FlagType.OBJECT: self.get_object_details,
+        }
+        results = []
+        for flag_type, key, default_value in flags:
+            try:
+                details = get_details[flag_type](key, default_value, evaluation_context)
+            except OpenFeatureError as e:
+                details = FlagEvaluationDetails(
+                    key=key,
+                    value=default_value,
+                    reason=Reason.ERROR,
+                    error_code=e.error_code or ErrorCode.GENERAL,
+                    error_message=e.error_message,
+                )
+            except Exception as e:  # noqa
+                details = FlagEvaluationDetails(
+                    key=key,
+                    value=default_value,
+                    reason=Reason.ERROR,
+                    error_code=ErrorCode.GENERAL,
+                    error_message=str(e),
+                )
+            results.append(details)
+        return results
+
+    def add_flag_change_listener(
+        self, listener: typing.Callable[[typing.FrozenSet[str]], None]
+    ):
+        """
+        :param listener: called with the keys of the changed flags, on the thread
+        which applied the change, so it must return quickly
+        """
+        with self._flag_change_lock:
+            self._flag_change_listeners = self._get_flag_change_listeners() + (
+                listener,
+            )
+
+    def remove_flag_change_listener(
+        self, listener: typing.Callable[[typing.FrozenSet[str]], None]
+    ):
+        with self._flag_change_lock:
+            self._flag_change_listeners = tuple(
+                registered
+                for registered in self._get_flag_change_listeners()
+                if registered != listener
+            )
+
+    def emit_flag_changes(self, keys: typing.Iterable[str]):
+        """
+        Notify the flag change listeners that the definition of flags changed.
+
+        :param keys: the keys of the flags which were added, updated or removed
+        """
+        keys = frozenset(keys)
+        if not keys:
+            return
+        for listener in self._get_flag_change_listeners():
+            try:
+                listener(keys)
+            except Exception:
+                logging.exception("Exception when notifying flag changes")
+
+    def _get_flag_change_listeners(self) -> typing.Tuple[typing.Callable, ...]:
+        # providers do not call a base __init__, so the listeners are created
+        # lazily; the tuple is replaced on change for lock free iteration
+        return getattr(self, "_flag_change_listeners", ())
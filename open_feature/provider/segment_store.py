@@ -0,0 +1,226 @@
+"""
+Compact storage for large allow/deny lists of targeting keys, usable by any local
+provider. Keys are reduced to 64 bit hashes kept in a sorted array (8 bytes per
+key instead of a Python str in a set) and looked up by binary search. Lists can be
+written to disk, as little-endian hashes, and memory-mapped so that only the pages
+visited by lookups are read. A segment can be fronted by an in-memory Bloom filter
+rejecting most non-members without a binary search, but building the filter of a
+mapped segment reads the whole file.
+
+Hashing means two distinct keys may collide, with a probability around n / 2^64
+per lookup for a list of n keys.
+"""
+import bisect
+import hashlib
+import math
+import mmap
+import os
+import struct
+import sys
+import typing
+from array import array
+
+from open_feature.exception.exceptions import ParseError
+
+MAGIC = b"OFKS"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<4sHHQ")
+
+
+def key_hash(key: str) -> int:
+    """
+    :param key: a targeting key
+    :return: the unsigned 64 bit hash the key is stored as
+    """
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class HashedKeySet:
+    """
+    Immutable set of keys stored as a sorted array of 64 bit hashes.
+    """
+
+    def __init__(self, hashes: typing.Sequence[int], mapped: mmap.mmap = None):
+        """
+        Use from_keys or open rather than this constructor.
+
+        :param hashes: the sorted, deduplicated key hashes
+        :param mapped: the memory map backing hashes, if any
+        """
+        self._hashes = hashes
+        self._mapped = mapped
+
+    @classmethod
+    def from_keys(cls, keys: typing.Iterable[str]) -> "HashedKeySet":
+        """
+        :param keys: the keys of the set
+        :return: a HashedKeySet held in memory
+        """
+        return cls(array("Q", sorted({key_hash(key) for key in keys})))
+
+    @classmethod
+    def open(cls, path: str) -> "HashedKeySet":
+        """
+        Memory-map a key set written by write, only the pages visited by lookups
+        are read from disk.
+
+        :param path: a file written by HashedKeySet.write
+        :return: a HashedKeySet backed by the file
+        """
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size < _HEADER.size:
+                # too short for a header, empty files cannot even be mapped
+                raise ParseError(error_message=f"'{path}' is not a key set file")
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, count = _HEADER.unpack_from(mapped, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            mapped.close()
+            raise ParseError(error_message=f"'{path}' is not a key set file")
+
+        start = _HEADER.size
+        end = start + count * 8
+        if len(mapped) < end:
+            mapped.close()
+            raise ParseError(
+                error_message=f"'{path}' is truncated, {count} keys do not fit"
+            )
+        if sys.byteorder != "little":
+            # the file is little-endian, big-endian hosts load a swapped copy
+            hashes = array("Q", mapped[start:end])
+            hashes.byteswap()
+            mapped.close()
+            return cls(hashes)
+        return cls(memoryview(mapped)[start:end].cast("Q"), mapped)
+
+    def write(self, path: str):
+        """
+        Write the key set to a file which can be memory-mapped with open.
+
+        :param path: the destination file
+        """
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(self._hashes)))
+            hashes = array("Q", self._hashes)
+            if sys.byteorder != "little":
+                hashes.byteswap()
+            file.write(hashes.tobytes())
+        os.replace(tmp_path, path)
+
+    def contains_hash(self, hashed: int) -> bool:
+        hashes = self._hashes
+        position = bisect.bisect_left(hashes, hashed)
+        return position < len(hashes) and hashes[position] == hashed
+
+    def __contains__(self, key: str) -> bool:
+        return self.contains_hash(key_hash(key))
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def __iter__(self) -> typing.Iterator[int]:
+        return iter(self._hashes)
+
+    def close(self):
+        if self._mapped is not None:
+            self._hashes.release()
+            self._mapped.close()
+
+
+class BloomFilter:
+    """
+    Probabilistic membership test over key hashes: no false negatives and about
+    false_positive_rate false positives, for roughly 10 bits per key at 1%.
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.01):
+        capacity = max(capacity, 1)
+        self.size = max(
+            8, int(-capacity * math.log(false_positive_rate) / (math.log(2) ** 2))
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def add(self, hashed: int):
+        for position in self._positions(hashed):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def might_contain(self, hashed: int) -> bool:
+        bits = self._bits
+        return all(
+            bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(hashed)
+        )
+
+    def _positions(self, hashed: int) -> typing.Iterator[int]:
+        # double hashing, deriving every position from the two halves of the hash
+        low, high = hashed & 0xFFFFFFFF, hashed >> 32
+        for i in range(self.hash_count):
+            yield (low + i * high) % self.size
+
+
+class Segment:
+    """
+    A named list of keys, with an optional Bloom filter pre-check.
+    """
+
+    def __init__(self, keys: HashedKeySet, bloom_filter: bool = False):
+        self.keys = keys
+        self.bloom_filter = None
+        if bloom_filter:
+            self.bloom_filter = BloomFilter(len(keys))
+            for hashed in keys:
+                self.bloom_filter.add(hashed)
+
+    def __contains__(self, key: str) -> bool:
+        hashed = key_hash(key)
+        bloom_filter = self.bloom_filter
+        if bloom_filter is not None and not bloom_filter.might_contain(hashed):
+            return False
+        return self.keys.contains_hash(hashed)
+
+
+class SegmentStore:
+    """
+    Registry of segments by name, answering segment membership conditions of
+    local providers such as the InMemoryProvider.
+    """
+
+    def __init__(self):
+        self._segments: typing.Dict[str, Segment] = {}
+
+    def add(self, name: str, keys: typing.Iterable[str], bloom_filter: bool = False):
+        """
+        Register a segment held in memory.
+
+        :param name: the segment name conditions refer to
+        :param keys: the targeting keys of the segment
+        :param bloom_filter: whether to check a Bloom filter before the key list
+        """
+        self._segments[name] = Segment(HashedKeySet.from_keys(keys), bloom_filter)
+
+    def add_file(self, name: str, path: str, bloom_filter: bool = False):
+        """
+        Register a segment memory-mapped from a file written by HashedKeySet.write.
+
+        :param name: the segment name conditions refer to
+        :param path: the key set file
+        :param bloom_filter: whether to keep a Bloom filter in memory in front of
+        the mapped key list, building it reads every page of the file up front
+        """
+        self._segments[name] = Segment(HashedKeySet.open(path), bloom_filter)
+
+    def contains(self, name: str, key: str) -> typing.Optional[bool]:
+        """
+        :param name: the segment name
+        :param key: the targeting key to look up
+        :return: whether the key belongs to the segment, None for an unknown
+        segment
+        """
+        segment = self._segments.get(name)
+        if segment is None:
+            return None
+        return key in segment
@@ -0,0 +1,292 @@
+import logging
+import threading
+import time
+import typing
+from collections import OrderedDict
+from dataclasses import dataclass
+from numbers import Number
+
+from open_feature.evaluation_context.evaluation_context import EvaluationContext
+from open_feature.flag_evaluation.error_code import ErrorCode
+from open_feature.flag_evaluation.flag_evaluation_details import FlagEvaluationDetails
+from open_feature.flag_evaluation.flag_type import FlagType
+from open_feature.flag_evaluation.immutable_value import freeze
+from open_feature.flag_evaluation.reason import Reason
+from open_feature.provider.count_min_sketch import CountMinSketch
+from open_feature.provider.provider import AbstractProvider
+
+_EntryKey = typing.Tuple[FlagType, str, typing.Hashable]
+
+
+# errors after which a result is kept, until it is refreshed or turns stale
+_TRANSIENT_ERROR_CODES = (ErrorCode.GENERAL, ErrorCode.PROVIDER_NOT_READY)
+
+
+@dataclass
+class _Entry:
+    details: FlagEvaluationDetails
+    evaluation_context: EvaluationContext
+    default_value: typing.Any
+    refreshed_at: float
+
+
+class TieredProvider(AbstractProvider):
+    """
+    Combines a slow authoritative provider, such as a remote one, with fast local
+    tiers, so that the few flags which make up most of the traffic never reach
+    the slow path.
+
+    An optional static local provider, for instance an InMemoryProvider over a
+    FlagSnapshot, is asked first and answers for every flag it knows. Otherwise
+    the evaluation frequency of each flag is tracked by a CountMinSketch, and the
+    results of flags evaluated at least promotion_threshold times recently are
+    promoted into a bounded local tier, keyed by flag type, flag key and
+    evaluation context, and answered with reason CACHED. Only results resolved to
+    a variant are promoted, an erroneous, DISABLED or variant-less result carries
+    the caller's default value, which other callers must not be served.
+
+    A background thread refreshes the promoted results from the authoritative
+    provider every refresh_interval seconds, in one batch per evaluation context,
+    and evicts the flags which turned cold. When the local tier is full, a new
+    result is only admitted if its flag is hotter than the least recently used
+    one it replaces. Results which could not be refreshed for two intervals are
+    no longer served.
+    """
+
+    def __init__(
+        self,
+        provider: AbstractProvider,
+        local_provider: AbstractProvider = None,
+        max_entries: int = 1024,
+        promotion_threshold: int = 4,
+        refresh_interval: float = 30.0,
+        sketch: CountMinSketch = None,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param provider: the authoritative provider
+        :param local_provider: a provider answering locally for the flags it
+        knows, asked before anything else
+        :param max_entries: the maximum number of results in the local tier
+        :param promotion_threshold: the estimated number of recent evaluations
+        which makes a flag hot
+        :param refresh_interval: seconds between two refreshes of the local tier,
+        None to refresh only when refresh is called
+        :param sketch: the frequency counter of the flags
+        :param clock: monotonic time source in seconds
+        """
+        self.provider = provider
+        self.local_provider = local_provider
+        self.max_entries = max_entries
+        self.promotion_threshold = promotion_threshold
+        self.refresh_interval = refresh_interval
+        self.sketch = sketch or CountMinSketch()
+        self.clock = clock
+
+        self._entries: typing.OrderedDict[_EntryKey, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._refresh_thread: typing.Optional[threading.Thread] = None
+        provider.add_flag_change_listener(self._on_flag_changes)
+
+    def get_name(self) -> str:
+        return self.provider.get_name()
+
+    def get_boolean_details(
+        self,
+        key: str,
+        default_value: bool,
+        evaluation_context: EvaluationContext = None,
+    ):
+        return self._evaluate(FlagType.BOOLEAN, key, default_value, evaluation_context)
+
+    def get_string_details(
+        self,
+        key: str,
+        default_value: str,
+        evaluation_context: EvaluationContext = None,
+    ):
+        return self._evaluate(FlagType.STRING, key, default_value, evaluation_context)
+
+    def get_number_details(
+        self,
+        key: str,
+        default_value: Number,
+        evaluation_context: EvaluationContext = None,
+    ):
+        return self._evaluate(FlagType.NUMBER, key, default_value, evaluation_context)
+
+    def get_object_details(
+        self,
+        key: str,
+        default_value: dict,
+        evaluation_context: EvaluationContext = None,
+    ):
+        return self._evaluate(FlagType.OBJECT, key, default_value, evaluation_context)
+
+    def refresh(self):
+        """
+        Evict the results of the flags which turned cold and resolve the others
+        again from the authoritative provider. Called periodically by the refresh
+        thread.
+        """
+        with self._lock:
+            cold = [
+                entry_key
+                for entry_key in self._entries
+                if self.sketch.estimate(entry_key[1]) < self.promotion_threshold
+            ]
+            for entry_key in cold:
+                del self._entries[entry_key]
+            by_context: typing.Dict[typing.Hashable, typing.List[_EntryKey]] = {}
+            contexts: typing.Dict[typing.Hashable, EvaluationContext] = {}
+            flags_by_context: typing.Dict[typing.Hashable, list] = {}
+            for entry_key, entry in self._entries.items():
+                flag_type, key, context_key = entry_key
+                by_context.setdefault(context_key, []).append(entry_key)
+                contexts[context_key] = entry.evaluation_context
+                flags_by_context.setdefault(context_key, []).append(
+                    (flag_type, key, entry.default_value)
+                )
+
+        for context_key, entry_keys in by_context.items():
+            flags = flags_by_context[context_key]
+            try:
+                results = self.provider.get_details_batch(flags, contexts[context_key])
+            except Exception:
+                logging.exception("Failed to refresh %d flags", len(flags))
+                continue
+
+            refreshed_at = self.clock()
+            with self._lock:
+                for entry_key, details in zip(entry_keys, results):
+                    entry = self._entries.get(entry_key)
+                    if entry is None:
+                        continue
+                    if _cacheable(details):
+                        entry.details = _cached(details)
+                        entry.refreshed_at = refreshed_at
+                    elif details.error_code not in _TRANSIENT_ERROR_CODES:
+                        # the flag is gone, disabled or no longer resolves
+                        del self._entries[entry_key]
+
+    def close(self):
+        """
+        Stop the refresh thread.
+        """
+        self._closed.set()
+        self.provider.remove_flag_change_listener(self._on_flag_changes)
+
+    def _evaluate(
+        self,
+        flag_type: FlagType,
+        key: str,
+        default_value: typing.Any,
+        evaluation_context: EvaluationContext = None,
+    ) -> FlagEvaluationDetails:
+        evaluation_context = evaluation_context or EvaluationContext()
+        if self.local_provider is not None:
+            details = self.local_provider.get_details_batch(
+                [(flag_type, key, default_value)], evaluation_context
+            )[0]
+            if details.error_code is not ErrorCode.FLAG_NOT_FOUND:
+                return details
+
+        entry_key = (flag_type, key, _context_key(evaluation_context))
+        with self._lock:
+            frequency = self.sketch.add(key)
+            entry = self._entries.get(entry_key)
+            if entry is not None:
+                if self._is_fresh(entry):
+                    self._entries.move_to_end(entry_key)
+                    return entry.details
+                del self._entries[entry_key]
+
+        details = self.provider.get_details_batch(
+            [(flag_type, key, default_value)], evaluation_context
+        )[0]
+        if frequency >= self.promotion_threshold and _cacheable(details):
+            self._promote(entry_key, details, evaluation_context, default_value)
+        return details
+
+    def _promote(
+        self,
+        entry_key: _EntryKey,
+        details: FlagEvaluationDetails,
+        evaluation_context: EvaluationContext,
+        default_value: typing.Any,
+    ):
+        entry = _Entry(
+            _cached(details), evaluation_context, default_value, self.clock()
+        )
+        with self._lock:
+            full = len(self._entries) >= self.max_entries
+            if full and entry_key not in self._entries:
+                # admit the result only if its flag is hotter than the least
+                # recently used one
+                victim_key = next(iter(self._entries))
+                victim_frequency = self.sketch.estimate(victim_key[1])
+                if victim_frequency > self.sketch.estimate(entry_key[1]):
+                    return
+                del self._entries[victim_key]
+            self._entries[entry_key] = entry
+        self._start_refresh_thread()
+
+    def _is_fresh(self, entry: _Entry) -> bool:
+        return (
+            self.refresh_interval is None
+            or self.clock() - entry.refreshed_at <= 2 * self.refresh_interval
+        )
+
+    def _start_refresh_thread(self):
+        if self._refresh_thread is not None or self.refresh_interval is None:
+            return
+        with self._lock:
+            if self._refresh_thread is None:
+                self._refresh_thread = threading.Thread(
+                    target=self._run_refresh,
+                    name="open-feature-tiered-refresh",
+                    daemon=True,
+                )
+                self._refresh_thread.start()
+
+    def _run_refresh(self):
+        while not self._closed.wait(self.refresh_interval):
+            try:
+                self.refresh()
+            except Exception:
+                logging.exception("Failed to refresh the local tier")
+
+    def _on_flag_changes(self, keys: typing.FrozenSet[str]):
+        with self._lock:
+            for entry_key in [k for k in self._entries if k[1] in keys]:
+                del self._entries[entry_key]
+        self.emit_flag_changes(keys)
+
+
+def _cacheable(details: FlagEvaluationDetails) -> bool:
+    return (
+        details.error_code is None
+        and details.variant is not None
+        and details.reason is not Reason.DISABLED
+    )
+
+
+def _cached(details: FlagEvaluationDetails) -> FlagEvaluationDetails:
+    # the result is shared by every caller served from the local tier
+    return FlagEvaluationDetails(
+        key=details.key,
+        value=freeze(details.value),
+        reason=Reason.CACHED,
+        variant=details.variant,
+    )
+
+
+def _context_key(evaluation_context: EvaluationContext) -> typing.Hashable:
+    attributes = tuple(sorted(evaluation_context.attributes.items()))
+    context_key = (evaluation_context.targeting_key, attributes)
+    try:
+        hash(context_key)
+    except TypeError:
+        context_key = (evaluation_context.targeting_key, repr(attributes))
+    return context_key
@@ -0,0 +1,111 @@
+import gzip
+import hashlib
+import json
+import threading
+import typing
+from dataclasses import asdict, dataclass, field
+
+from open_feature.evaluation_context.evaluation_context import EvaluationContext
+from open_feature.flag_evaluation.immutable_value import thaw
+
+
+@dataclass
+class EvaluationRecord:
+    """
+    One recorded flag evaluation: what was asked and what was answered.
+    """
+
+    flag_key: str
+    flag_type: str
+    default_value: typing.Any
+    context_fingerprint: str
+    targeting_key: typing.Optional[str] = None
+    attributes: dict = field(default_factory=dict)
+    value: typing.Any = None
+    variant: typing.Optional[str] = None
+    reason: typing.Optional[str] = None
+    error_code: typing.Optional[str] = None
+    timestamp: float = 0.0
+    # names of the inputs recorded as digests, "targeting_key" included
+    redacted: typing.List[str] = field(default_factory=list)
+
+    def evaluation_context(self) -> EvaluationContext:
+        return EvaluationContext(self.targeting_key, dict(self.attributes))
+
+
+def context_fingerprint(
+    evaluation_context: EvaluationContext, salt: bytes = b""
+) -> str:
+    """
+    Stable digest identifying an evaluation context, computed before any attribute
+    is sanitized so that recordings of the same context can be correlated.
+
+    :param evaluation_context: the context to identify
+    :param salt: secret mixed into the digest, so that it cannot be reversed by
+    hashing candidate contexts
+    :return: a short hexadecimal digest
+    """
+    payload = json.dumps(
+        [evaluation_context.targeting_key, evaluation_context.attributes],
+        sort_keys=True,
+        default=str,
+    )
+    return salted_digest(payload, salt)
+
+
+def salted_digest(value: str, salt: bytes) -> str:
+    """
+    :param value: the value to digest
+    :param salt: secret key of the digest, up to 64 bytes
+    :return: a short hexadecimal digest of the value
+    """
+    return hashlib.blake2b(value.encode("utf-8"), key=salt, digest_size=8).hexdigest()
+
+
+def _open(path: str, mode: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class EvaluationLogWriter:
+    """
+    Appends EvaluationRecords to a JSON lines file, gzip compressed when the path
+    ends with ".gz". Safe to share between threads.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = _open(path, "a")
+        self._lock = threading.Lock()
+
+    def write(self, record: EvaluationRecord):
+        line = json.dumps(asdict(record), separators=(",", ":"), default=_encode)
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> "EvaluationLogWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_evaluation_log(path: str) -> typing.Iterator[EvaluationRecord]:
+    """
+    :param path: a file written by an EvaluationLogWriter
+    :return: the records of the file, in recording order
+    """
+    with _open(path, "r") as file:
+        for line in file:
+            if line.strip():
+                yield EvaluationRecord(**json.loads(line))
+
+
+def _encode(value: typing.Any) -> typing.Any:
+    thawed = thaw(value)
+    return str(value) if thawed is value else thawed
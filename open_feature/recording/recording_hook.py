@@ -0,0 +1,139 @@
+import logging
+import os
+import random
+import time
+import typing
+
+from open_feature.exception.exceptions import OpenFeatureError
+from open_feature.flag_evaluation.error_code import ErrorCode
+from open_feature.flag_evaluation.flag_evaluation_details import FlagEvaluationDetails
+from open_feature.flag_evaluation.flag_type import FlagType
+from open_feature.flag_evaluation.immutable_value import thaw
+from open_feature.flag_evaluation.reason import Reason
+from open_feature.hooks.hook import Hook
+from open_feature.hooks.hook_context import HookContext
+from open_feature.recording.evaluation_log import (
+    EvaluationLogWriter,
+    EvaluationRecord,
+    context_fingerprint,
+    salted_digest,
+)
+
+
+class RecordingHook(Hook):
+    """
+    Records evaluations into an evaluation log so that production traffic can be
+    replayed offline against any provider. Only the after and error stages are
+    implemented, the others cost nothing.
+
+    Attributes are sanitized by default: only the values of the allowlisted
+    recorded_attributes are written as is, every other value is replaced by a
+    salted digest. A digest never equals the value a targeting rule compares it
+    with, so evaluations targeted on redacted attributes may replay differently,
+    the records list their redacted inputs so that replay can flag those diffs.
+
+    Failing to record is logged and never affects the evaluation observed.
+    """
+
+    def __init__(
+        self,
+        writer: EvaluationLogWriter,
+        recorded_attributes: typing.Iterable[str] = (),
+        redact_targeting_key: bool = False,
+        sample_rate: float = 1.0,
+        salt: bytes = None,
+    ):
+        """
+        :param writer: where the records are written
+        :param recorded_attributes: attributes whose values are recorded as is,
+        the others are replaced by a digest
+        :param redact_targeting_key: whether the targeting key is replaced by a
+        digest too
+        :param sample_rate: share of the evaluations to record, between 0 and 1
+        :param salt: secret key of the digests, up to 64 bytes. A random salt is
+        drawn by default, pass one to correlate digests across recordings
+        """
+        self.writer = writer
+        self.recorded_attributes = frozenset(recorded_attributes)
+        self.redact_targeting_key = redact_targeting_key
+        self.sample_rate = sample_rate
+        self.salt = os.urandom(16) if salt is None else salt
+
+    def after(
+        self, hook_context: HookContext, details: FlagEvaluationDetails, hints: dict
+    ):
+        if self._sampled():
+            self._write(
+                hook_context,
+                value=details.value,
+                variant=details.variant,
+                reason=details.reason,
+                error_code=details.error_code,
+            )
+
+    def error(self, hook_context: HookContext, exception: Exception, hints: dict):
+        if self._sampled():
+            error_code = ErrorCode.GENERAL
+            if isinstance(exception, OpenFeatureError) and exception.error_code:
+                error_code = exception.error_code
+            self._write(
+                hook_context,
+                value=hook_context.default_value,
+                variant=None,
+                reason=Reason.ERROR,
+                error_code=error_code,
+            )
+
+    def supports_flag_value_type(self, flag_type: FlagType) -> bool:
+        return True
+
+    def _sampled(self) -> bool:
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+    def _write(self, hook_context: HookContext, **result):
+        # the after stage runs unchecked, an error here would fail the evaluation
+        try:
+            self.writer.write(self._record(hook_context, **result))
+        except Exception:
+            logging.exception(
+                "Failed to record the evaluation of flag '%s'", hook_context.flag_key
+            )
+
+    def _record(
+        self,
+        hook_context: HookContext,
+        value: typing.Any,
+        variant: typing.Optional[str],
+        reason: typing.Optional[Reason],
+        error_code: typing.Optional[ErrorCode],
+    ) -> EvaluationRecord:
+        evaluation_context = hook_context.evaluation_context
+        redacted = []
+        targeting_key = evaluation_context.targeting_key
+        if self.redact_targeting_key and targeting_key is not None:
+            targeting_key = self._redact(targeting_key)
+            redacted.append("targeting_key")
+        attributes = {}
+        for name, attribute in evaluation_context.attributes.items():
+            if name in self.recorded_attributes:
+                attributes[name] = thaw(attribute)
+            else:
+                attributes[name] = self._redact(attribute)
+                redacted.append(name)
+        return EvaluationRecord(
+            flag_key=hook_context.flag_key,
+            flag_type=hook_context.flag_type.name,
+            default_value=thaw(hook_context.default_value),
+            context_fingerprint=context_fingerprint(evaluation_context, self.salt),
+            targeting_key=targeting_key,
+            attributes=attributes,
+            value=thaw(value),
+            variant=variant,
+            reason=reason.value if isinstance(reason, Reason) else reason,
+            error_code=error_code.value if error_code else None,
+            timestamp=time.time(),
+            redacted=redacted,
+        )
+
+    def _redact(self, value: typing.Any) -> str:
+        return f"redacted:{salted_digest(str(value), self.salt)}"
@@ -0,0 +1,196 @@
+"""
+Replay a recorded evaluation log against a provider, to benchmark it and to check
+it still answers like the recording.
+
+    python -m open_feature.recording.replay evaluations.jsonl.gz \
+        --provider my_package.flags:create_provider --rate 500
+
+Any difference fails the replay, pass --allow-redacted-diffs to tolerate those
+which may come from targeting on redacted inputs.
+"""
+import argparse
+import importlib
+import json
+import sys
+import time
+import typing
+from dataclasses import dataclass, field
+
+from open_feature.flag_evaluation.flag_type import FlagType
+from open_feature.flag_evaluation.immutable_value import thaw
+from open_feature.flag_evaluation.reason import Reason
+from open_feature.open_feature_client import OpenFeatureClient
+from open_feature.recording.evaluation_log import EvaluationRecord, read_evaluation_log
+
+# reasons of results which depend on the evaluation context
+_TARGETING_REASONS = frozenset({Reason.TARGETING_MATCH.value, Reason.SPLIT.value})
+
+
+@dataclass
+class ReplayDiff:
+    flag_key: str
+    context_fingerprint: str
+    expected: typing.Any
+    actual: typing.Any
+    # the record has redacted inputs and either result came from targeting, so
+    # the diff may come from targeting on a redacted input
+    redacted: bool = False
+
+
+@dataclass
+class ReplayReport:
+    evaluations: int
+    duration: float
+    # latency percentiles in seconds, keyed by percentile
+    latencies: typing.Dict[int, float] = field(default_factory=dict)
+    diffs: typing.List[ReplayDiff] = field(default_factory=list)
+    diff_count: int = 0
+    # diffs which may come from redacted inputs, included in diff_count
+    redacted_diff_count: int = 0
+
+    @property
+    def throughput(self) -> float:
+        return self.evaluations / self.duration if self.duration else 0.0
+
+
+def replay(
+    client: OpenFeatureClient,
+    records: typing.Iterable[EvaluationRecord],
+    rate: float = None,
+    max_diffs: int = 100,
+) -> ReplayReport:
+    """
+    Evaluate every recorded flag through the client and compare the results with
+    the recording. Redacted inputs are replayed as their digests, so a targeted
+    result may differ from the recorded one. A diff is flagged as redacted, and
+    counted apart in redacted_diff_count, when its record has redacted inputs
+    and the recorded or replayed result came from targeting; the other diffs
+    cannot be explained by redaction.
+
+    :param client: the client to evaluate with, configured with the provider under
+    test
+    :param records: the recorded evaluations
+    :param rate: evaluations per second to replay at, None to go as fast as possible
+    :param max_diffs: the maximum number of differences kept in the report
+    :return: a ReplayReport with throughput, latency percentiles and differences
+    """
+    latencies = []
+    diffs = []
+    diff_count = 0
+    redacted_diff_count = 0
+
+    start = time.perf_counter()
+    for index, record in enumerate(records):
+        if rate:
+            delay = start + index / rate - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+        evaluation_context = record.evaluation_context()
+        flag_type = FlagType[record.flag_type]
+        evaluation_start = time.perf_counter()
+        details = client.evaluate_flag_details(
+            flag_type, record.flag_key, record.default_value, evaluation_context
+        )
+        latencies.append(time.perf_counter() - evaluation_start)
+
+        expected = _result(record.value, record.variant, record.error_code)
+        actual = _result(
+            details.value,
+            details.variant,
+            details.error_code.value if details.error_code else None,
+        )
+        if actual != expected:
+            diff_count += 1
+            redacted = bool(record.redacted) and (
+                record.reason in _TARGETING_REASONS
+                or _reason(details.reason) in _TARGETING_REASONS
+            )
+            redacted_diff_count += redacted
+            if len(diffs) < max_diffs:
+                diffs.append(
+                    ReplayDiff(
+                        record.flag_key,
+                        record.context_fingerprint,
+                        expected,
+                        actual,
+                        redacted,
+                    )
+                )
+
+    duration = time.perf_counter() - start
+    return ReplayReport(
+        evaluations=len(latencies),
+        duration=duration,
+        latencies=_percentiles(latencies, (50, 90, 99, 100)),
+        diffs=diffs,
+        diff_count=diff_count,
+        redacted_diff_count=redacted_diff_count,
+    )
+
+
+def _reason(reason) -> typing.Optional[str]:
+    return reason.value if isinstance(reason, Reason) else reason
+
+
+def _result(value, variant, error_code) -> dict:
+    # round trip through JSON so live values compare like recorded ones
+    value = json.loads(json.dumps(thaw(value), default=str))
+    return {"value": value, "variant": variant, "error_code": error_code}
+
+
+def _percentiles(
+    latencies: typing.List[float], percentiles: typing.Iterable[int]
+) -> typing.Dict[int, float]:
+    if not latencies:
+        return {}
+    ordered = sorted(latencies)
+    return {
+        percentile: ordered[max(0, -(-len(ordered) * percentile // 100) - 1)]
+        for percentile in percentiles
+    }
+
+
+def main(argv: typing.List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("log", help="evaluation log written by a RecordingHook")
+    parser.add_argument(
+        "--provider",
+        required=True,
+        help="module:callable returning the provider to replay against",
+    )
+    parser.add_argument("--rate", type=float, help="evaluations per second")
+    parser.add_argument(
+        "--allow-redacted-diffs",
+        action="store_true",
+        help="do not fail on diffs which may come from redacted inputs",
+    )
+    args = parser.parse_args(argv)
+
+    module_name, _, factory_name = args.provider.partition(":")
+    provider = getattr(importlib.import_module(module_name), factory_name)()
+    client = OpenFeatureClient(name="replay", version=None, provider=provider)
+
+    report = replay(client, read_evaluation_log(args.log), args.rate)
+
+    lines = [
+        f"evaluations={report.evaluations} "
+        f"evaluations/s={report.throughput:,.0f} diffs={report.diff_count} "
+        f"redacted_diffs={report.redacted_diff_count}"
+    ]
+    for percentile, latency in report.latencies.items():
+        lines.append(f"p{percentile}={latency * 1e6:,.1f}us")
+    for diff in report.diffs:
+        lines.append(
+            f"{diff.flag_key} [{diff.context_fingerprint}]: "
+            f"expected {diff.expected}, got {diff.actual}"
+            f"{' (redacted inputs)' if diff.redacted else ''}"
+        )
+    print("\n".join(lines))  # noqa: T001, T201
+
+    tolerated = report.redacted_diff_count if args.allow_redacted_diffs else 0
+    return 1 if report.diff_count > tolerated else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
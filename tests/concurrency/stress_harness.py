@@ -0,0 +1,312 @@
+"""
+Concurrency stress and scaling harness for the SDK.
+
+Worker threads run mixed flag evaluations against a shared client while a swapper
+thread keeps replacing the provider, the client hooks and the API evaluation
+context underneath them. Every evaluation is checked for context corruption
+(another worker's attributes, a stale or foreign API context) and the number of
+evaluations seen by the providers is reconciled with the number performed, to
+catch lost updates. Runs on regular and free-threaded CPython builds.
+
+    python -m tests.concurrency.stress_harness --threads 1,2,4,8 --duration 2
+"""
+import argparse
+import json
+import sys
+import threading
+import time
+import typing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from open_feature import open_feature_api as api
+from open_feature.evaluation_context.evaluation_context import EvaluationContext
+from open_feature.flag_evaluation.flag_evaluation_details import FlagEvaluationDetails
+from open_feature.flag_evaluation.flag_type import FlagType
+from open_feature.flag_evaluation.reason import Reason
+from open_feature.hooks.hook import Hook
+from open_feature.open_feature_evaluation_context import (
+    api_evaluation_context,
+    set_api_evaluation_context,
+)
+from open_feature.provider.provider import AbstractProvider
+
+_ALLOWED_ATTRIBUTES = {"worker", "seq", "generation", "client"}
+_MAX_REPORTED_ANOMALIES = 20
+_MAX_SWAPPED_HOOKS = 16
+
+
+@dataclass
+class StressReport:
+    threads: int
+    processes: int
+    evaluations: int
+    duration: float
+    anomalies: typing.List[str] = field(default_factory=list)
+    anomaly_count: int = 0
+
+    @property
+    def throughput(self) -> float:
+        return self.evaluations / self.duration if self.duration else 0.0
+
+
+class _EchoProvider(AbstractProvider):
+    """
+    Answers string flags with the evaluation context it received, so workers can
+    verify the context their evaluation was made with.
+    """
+
+    def __init__(self, generation: int, counter: "_Counter"):
+        self.generation = generation
+        self.counter = counter
+
+    def get_name(self) -> str:
+        return "Echo Provider"
+
+    def get_boolean_details(self, key, default_value, evaluation_context=None):
+        return self._details(key, True)
+
+    def get_number_details(self, key, default_value, evaluation_context=None):
+        return self._details(key, self.generation)
+
+    def get_object_details(self, key, default_value, evaluation_context=None):
+        return self._details(key, {"generation": self.generation})
+
+    def get_string_details(self, key, default_value, evaluation_context=None):
+        context = evaluation_context or EvaluationContext()
+        echo = json.dumps(
+            {"targeting_key": context.targeting_key, "attributes": context.attributes},
+            default=str,
+        )
+        return self._details(key, echo)
+
+    def _details(self, key, value) -> FlagEvaluationDetails:
+        self.counter.increment()
+        return FlagEvaluationDetails(
+            key=key,
+            value=value,
+            reason=Reason.TARGETING_MATCH,
+            variant=str(self.generation),
+        )
+
+
+class _NoOpHook(Hook):
+    def supports_flag_value_type(self, flag_type: FlagType) -> bool:
+        return True
+
+
+class _Counter:
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def increment(self):
+        with self._lock:
+            self.value += 1
+
+
+class _Anomalies:
+    def __init__(self):
+        self.messages: typing.List[str] = []
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def add(self, message: str):
+        with self._lock:
+            self.count += 1
+            if len(self.messages) < _MAX_REPORTED_ANOMALIES:
+                self.messages.append(message)
+
+
+def run_stress(
+    threads: int, duration: float = 1.0, swap_interval: float = 0.001
+) -> StressReport:
+    """
+    Run a stress round in the current process.
+
+    :param threads: the number of worker threads evaluating flags
+    :param duration: how long the workers run, in seconds
+    :param swap_interval: pause between two swaps of provider, hooks and API context
+    :return: a StressReport with the throughput and any detected anomaly
+    """
+    previous_provider = api.get_provider()
+    previous_context = api_evaluation_context()
+
+    counter = _Counter()
+    anomalies = _Anomalies()
+    set_api_evaluation_context(EvaluationContext(attributes={"generation": 0}))
+    api.set_provider(_EchoProvider(0, counter))
+    client = api.get_client("stress")
+    client.context = EvaluationContext(attributes={"client": "stress"})
+
+    stop = threading.Event()
+    evaluations = [0] * threads
+
+    def swap():
+        generation = 0
+        while not stop.is_set():
+            generation += 1
+            provider = _EchoProvider(generation, counter)
+            api.set_provider(provider)
+            client.provider = provider
+            set_api_evaluation_context(
+                EvaluationContext(attributes={"generation": generation})
+            )
+            if len(client.hooks) < _MAX_SWAPPED_HOOKS:
+                client.add_hooks([_NoOpHook()])
+            time.sleep(swap_interval)
+
+    def work(worker: int):
+        seq = 0
+        last_generation = 0
+        while not stop.is_set():
+            seq += 1
+            context = EvaluationContext(
+                f"worker-{worker}", {"worker": worker, "seq": seq}
+            )
+            details = client.get_string_details("echo", "", context)
+            last_generation = _check_echo(
+                details, worker, seq, last_generation, anomalies
+            )
+            client.get_boolean_value("flag", False, context)
+            client.get_number_value("flag", 0, context)
+            client.get_object_value("flag", {}, context)
+            session = client.evaluation_session(context)
+            session.get_boolean_value("flag", False)
+            session.get_boolean_value("flag", False)
+            evaluations[worker] += 5
+
+        if api_evaluation_context().attributes.keys() != {"generation"}:
+            anomalies.add("API evaluation context was mutated by evaluations")
+
+    workers = [threading.Thread(target=work, args=(i,)) for i in range(threads)]
+    swapper = threading.Thread(target=swap)
+    start = time.perf_counter()
+    try:
+        swapper.start()
+        for worker in workers:
+            worker.start()
+        time.sleep(duration)
+        stop.set()
+        for worker in workers:
+            worker.join()
+        swapper.join()
+    finally:
+        elapsed = time.perf_counter() - start
+        if previous_provider is not None:
+            api.set_provider(previous_provider)
+        set_api_evaluation_context(previous_context)
+
+    total = sum(evaluations)
+    if counter.value != total:
+        anomalies.add(
+            f"Lost updates: providers saw {counter.value} evaluations, "
+            f"workers made {total}"
+        )
+
+    return StressReport(
+        threads=threads,
+        processes=1,
+        evaluations=total,
+        duration=elapsed,
+        anomalies=anomalies.messages,
+        anomaly_count=anomalies.count,
+    )
+
+
+def _check_echo(
+    details: FlagEvaluationDetails,
+    worker: int,
+    seq: int,
+    last_generation: int,
+    anomalies: _Anomalies,
+) -> int:
+    if details.error_code is not None:
+        anomalies.add(f"Worker {worker} got error {details.error_code}")
+        return last_generation
+
+    echo = json.loads(details.value)
+    attributes = echo["attributes"]
+    if echo["targeting_key"] != f"worker-{worker}":
+        anomalies.add(f"Worker {worker} evaluated with {echo['targeting_key']}")
+    if attributes.get("worker") != worker or attributes.get("seq") != seq:
+        anomalies.add(f"Worker {worker} seq {seq} evaluated with {attributes}")
+    if not attributes.keys() <= _ALLOWED_ATTRIBUTES:
+        anomalies.add(f"Worker {worker} evaluated with foreign attributes")
+
+    generation = attributes.get("generation", -1)
+    if generation < last_generation:
+        anomalies.add(
+            f"Worker {worker} saw API context generation {generation} "
+            f"after {last_generation}"
+        )
+    return max(generation, last_generation)
+
+
+def run_stress_processes(
+    processes: int, threads: int, duration: float = 1.0
+) -> StressReport:
+    """
+    Run one stress round per process in a process pool and aggregate the reports,
+    as a baseline free of any interpreter level contention.
+
+    :param processes: the number of processes
+    :param threads: the number of worker threads in each process
+    :param duration: how long the workers run, in seconds
+    :return: the aggregated StressReport
+    """
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        reports = list(
+            executor.map(run_stress, [threads] * processes, [duration] * processes)
+        )
+    anomalies = [message for report in reports for message in report.anomalies]
+    return StressReport(
+        threads=threads,
+        processes=processes,
+        evaluations=sum(report.evaluations for report in reports),
+        duration=max(report.duration for report in reports),
+        anomalies=anomalies[:_MAX_REPORTED_ANOMALIES],
+        anomaly_count=sum(report.anomaly_count for report in reports),
+    )
+
+
+def gil_enabled() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled() if is_gil_enabled else True
+
+
+def main(argv: typing.List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--threads", default="1,2,4,8")
+    parser.add_argument("--processes", type=int, default=0)
+    parser.add_argument("--duration", type=float, default=2.0)
+    args = parser.parse_args(argv)
+
+    print(  # noqa: T001, T201
+        f"Python {sys.version.split()[0]}, GIL enabled: {gil_enabled()}"
+    )
+
+    reports = [
+        run_stress(int(threads), args.duration) for threads in args.threads.split(",")
+    ]
+    if args.processes:
+        reports.append(
+            run_stress_processes(args.processes, int(reports[0].threads), args.duration)
+        )
+
+    baseline = reports[0].throughput or 1.0
+    for report in reports:
+        print(  # noqa: T001, T201
+            f"processes={report.processes} threads={report.threads} "
+            f"evaluations/s={report.throughput:,.0f} "
+            f"scaling={report.throughput / baseline:.2f}x "
+            f"anomalies={report.anomaly_count}"
+        )
+        for message in report.anomalies:
+            print(f"    {message}")  # noqa: T001, T201
+
+    return 1 if any(report.anomaly_count for report in reports) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
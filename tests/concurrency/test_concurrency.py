@@ -0,0 +1,13 @@
+from tests.concurrency.stress_harness import run_stress
+
+
+def test_concurrent_evaluations_keep_contexts_isolated():
+    # Given
+    threads = 4
+
+    # When
+    report = run_stress(threads=threads, duration=0.3)
+
+    # Then
+    assert report.evaluations > 0
+    assert report.anomaly_count == 0, report.anomalies
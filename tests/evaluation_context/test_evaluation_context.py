@@ -45,3 +45,21 @@ def test_second_targeting_key_overwrites_first():
 
     # Then
     assert merged_context.targeting_key == second_context.targeting_key
+
+
+def test_merge_does_not_mutate_merged_contexts():
+    # Given
+    first_context = EvaluationContext(
+        targeting_key="targeting_key1", attributes={"att1": "value1"}
+    )
+    second_context = EvaluationContext(
+        targeting_key="targeting_key2", attributes={"att2": "value2"}
+    )
+
+    # When
+    merged_context = first_context.merge(second_context)
+
+    # Then
+    assert merged_context.attributes == {"att1": "value1", "att2": "value2"}
+    assert first_context.attributes == {"att1": "value1"}
+    assert first_context.targeting_key == "targeting_key1"
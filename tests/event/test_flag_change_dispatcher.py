@@ -0,0 +1,115 @@
+import asyncio
+import threading
+
+from open_feature.open_feature_client import OpenFeatureClient
+from open_feature.provider.in_memory.in_memory_flag import InMemoryFlag
+from open_feature.provider.in_memory.in_memory_provider import InMemoryProvider
+
+
+def _flag(value):
+    return InMemoryFlag(variants={"v": value}, default_variant="v")
+
+
+def _client():
+    provider = InMemoryProvider({"limit": _flag(10), "route": _flag("a")})
+    return OpenFeatureClient(name=None, version=None, provider=provider), provider
+
+
+def test_on_flag_changed_notifies_subscribed_keys_only():
+    # Given
+    client, provider = _client()
+    received = []
+    delivered = threading.Event()
+
+    def callback(keys):
+        received.append(keys)
+        delivered.set()
+
+    client.on_flag_changed(["limit"], callback)
+
+    # When
+    provider.update_flags({"route": _flag("b")})
+    provider.update_flags({"limit": _flag(10)})
+    provider.update_flags({"limit": _flag(20)})
+
+    # Then
+    assert delivered.wait(5)
+    assert received == [frozenset({"limit"})]
+    assert client.get_number_value("limit", 0) == 20
+
+
+def test_on_flag_changed_coalesces_pending_changes():
+    # Given
+    client, provider = _client()
+    received = []
+    started = threading.Event()
+    release = threading.Event()
+    delivered = threading.Event()
+
+    def callback(keys):
+        received.append(keys)
+        started.set()
+        release.wait(5)
+        if len(received) == 2:
+            delivered.set()
+
+    client.on_flag_changed(None, callback)
+    provider.update_flags({"limit": _flag(1)})
+    assert started.wait(5)
+
+    # When
+    provider.update_flags({"limit": _flag(2)})
+    provider.update_flags({"route": None})
+    release.set()
+
+    # Then
+    assert delivered.wait(5)
+    assert received[0] == frozenset({"limit"})
+    assert received[1] == frozenset({"limit", "route"})
+
+
+def test_on_flag_changed_delivers_on_event_loop_until_unsubscribed():
+    # Given
+    client, provider = _client()
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        received = loop.create_future()
+        subscription = client.on_flag_changed(["route"], received.set_result, loop=loop)
+        await loop.run_in_executor(None, provider.update_flags, {"route": _flag("c")})
+        keys = await asyncio.wait_for(received, 5)
+        subscription.unsubscribe()
+        provider.update_flags({"route": _flag("d")})
+        await asyncio.sleep(0)
+        return keys
+
+    # When
+    keys = asyncio.run(scenario())
+
+    # Then
+    assert keys == frozenset({"route"})
+
+
+def test_close_stops_the_dispatcher_and_removes_its_listener():
+    # Given
+    client, provider = _client()
+    received = []
+    delivered = threading.Event()
+
+    def callback(keys):
+        received.append(keys)
+        delivered.set()
+
+    client.on_flag_changed(None, callback)
+    provider.update_flags({"limit": _flag(1)})
+    assert delivered.wait(5)
+    dispatcher = client._flag_change_dispatcher
+
+    # When
+    client.close()
+    provider.update_flags({"limit": _flag(2)})
+
+    # Then
+    assert not dispatcher._thread.is_alive()
+    assert provider._get_flag_change_listeners() == ()
+    assert received == [frozenset({"limit"})]
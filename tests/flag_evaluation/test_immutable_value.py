@@ -0,0 +1,31 @@
+from types import MappingProxyType
+
+import pytest
+
+from open_feature.flag_evaluation.immutable_value import freeze, thaw
+
+
+def test_freeze_builds_deeply_read_only_value():
+    # Given
+    value = {"limits": {"rps": 10}, "regions": ["eu", "us"]}
+
+    # When
+    frozen = freeze(value)
+
+    # Then
+    assert isinstance(frozen, MappingProxyType)
+    assert frozen["regions"] == ("eu", "us")
+    with pytest.raises(TypeError):
+        frozen["limits"]["rps"] = 20
+
+
+def test_thaw_builds_mutable_copy_of_frozen_value():
+    # Given
+    value = {"limits": {"rps": 10}, "regions": ["eu", "us"]}
+
+    # When
+    thawed = thaw(freeze(value))
+    thawed["limits"]["rps"] = 20
+
+    # Then
+    assert thawed == {"limits": {"rps": 20}, "regions": ["eu", "us"]}
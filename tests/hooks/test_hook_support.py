@@ -1,12 +1,17 @@
+from unittest import mock
+
 from open_feature.flag_evaluation.flag_evaluation_details import FlagEvaluationDetails
 from open_feature.flag_evaluation.flag_type import FlagType
+from open_feature.hooks.hook import Hook
 from open_feature.hooks.hook_context import HookContext
 from open_feature.hooks.hook_support import (
     after_all_hooks,
     after_hooks,
     before_hooks,
     error_hooks,
+    hooks_by_stage,
 )
+from open_feature.hooks.hook_type import HookType
 
 
 def test_error_hooks_run_error_method(mock_hook):
@@ -52,3 +57,44 @@ def test_finally_after_hooks_run_finally_after_method(mock_hook):
     # Then
     mock_hook.supports_flag_value_type.assert_called_once()
     mock_hook.finally_after.assert_called_once()
+
+
+def test_hooks_by_stage_only_keeps_overridden_stages(mock_hook):
+    # Given
+    class AfterHook(Hook):
+        def after(self, hook_context, details, hints):
+            pass
+
+    after_hook = AfterHook()
+
+    # When
+    stages = hooks_by_stage([after_hook, mock_hook])
+
+    # Then
+    assert stages[HookType.AFTER] == [after_hook, mock_hook]
+    assert stages[HookType.BEFORE] == [mock_hook]
+    assert stages[HookType.ERROR] == [mock_hook]
+    assert stages[HookType.FINALLY_AFTER] == [mock_hook]
+
+
+def test_stage_without_hooks_calls_nothing():
+    # Given
+    class AfterHook(Hook):
+        def after(self, hook_context, details, hints):
+            pass
+
+    after_hook = AfterHook()
+    after_hook.supports_flag_value_type = mock.MagicMock(return_value=True)
+    hook_context = HookContext("flag_key", FlagType.BOOLEAN, True, "")
+
+    # When
+    context = before_hooks(
+        FlagType.BOOLEAN,
+        hook_context,
+        hooks_by_stage([after_hook])[HookType.BEFORE],
+        {},
+    )
+
+    # Then
+    assert context.attributes == {}
+    after_hook.supports_flag_value_type.assert_not_called()
@@ -0,0 +1,228 @@
+import asyncio
+import threading
+
+from open_feature.evaluation_context.evaluation_context import EvaluationContext
+from open_feature.exception.exceptions import FlagNotFoundError
+from open_feature.flag_evaluation.error_code import ErrorCode
+from open_feature.flag_evaluation.flag_type import FlagType
+from open_feature.hooks.hook import Hook
+from open_feature.middleware.asgi import OpenFeatureASGIMiddleware
+from open_feature.middleware.request_session import current_session
+from open_feature.middleware.route_flag_learner import RouteFlagLearner
+from open_feature.middleware.wsgi import OpenFeatureWSGIMiddleware
+from open_feature.open_feature_client import OpenFeatureClient
+from open_feature.provider.in_memory.in_memory_flag import (
+    Condition,
+    InMemoryFlag,
+    Operator,
+    TargetingRule,
+)
+from open_feature.provider.in_memory.in_memory_provider import InMemoryProvider
+
+
+class CountingProvider(InMemoryProvider):
+    def __init__(self, flags):
+        super().__init__(flags)
+        self.single_calls = 0
+        self.batch_calls = 0
+
+    def get_boolean_details(self, *args, **kwargs):
+        self.single_calls += 1
+        return super().get_boolean_details(*args, **kwargs)
+
+    def get_string_details(self, *args, **kwargs):
+        self.single_calls += 1
+        return super().get_string_details(*args, **kwargs)
+
+    def get_details_batch(self, flags, evaluation_context=None):
+        self.batch_thread = threading.current_thread()
+        self.batch_calls += 1
+        self.single_calls -= len(flags)
+        return super().get_details_batch(flags, evaluation_context)
+
+
+FLAGS = {
+    "checkout": InMemoryFlag(
+        variants={"on": True, "off": False},
+        default_variant="off",
+        rules=[TargetingRule("on", [Condition("plan", Operator.EQUALS, "pro")])],
+    ),
+    "theme": InMemoryFlag(variants={"dark": "dark"}, default_variant="dark"),
+    "banner": InMemoryFlag(variants={"on": "on"}, default_variant="on", enabled=False),
+}
+
+
+def _client():
+    provider = CountingProvider(FLAGS)
+    return OpenFeatureClient(name=None, version=None, provider=provider), provider
+
+
+def _wsgi_app(environ, start_response):
+    session = current_session()
+    assert session is environ["openfeature.session"]
+    checkout = session.get_boolean_value("checkout", False)
+    theme = session.get_string_value("theme", "light")
+    start_response("200 OK", [])
+    return [f"{checkout} {theme}".encode()]
+
+
+def test_wsgi_middleware_prefetches_learned_route_flags():
+    # Given
+    client, provider = _client()
+    app = OpenFeatureWSGIMiddleware(
+        _wsgi_app,
+        client,
+        context_builder=lambda environ: EvaluationContext(
+            attributes={"plan": environ["HTTP_X_PLAN"]}
+        ),
+    )
+    environ = {"REQUEST_METHOD": "GET", "PATH_INFO": "/", "HTTP_X_PLAN": "pro"}
+
+    # When
+    first = app(dict(environ), lambda status, headers: None)
+    single_calls = provider.single_calls
+    second = app(dict(environ), lambda status, headers: None)
+
+    # Then
+    assert first == second == [b"True dark"]
+    assert single_calls == 2
+    assert provider.batch_calls == 1
+    assert provider.single_calls == 2
+    assert current_session() is None
+
+
+def test_asgi_middleware_prefetches_learned_route_flags():
+    # Given
+    client, provider = _client()
+    results = []
+
+    async def app(scope, receive, send):
+        session = scope["openfeature.session"]
+        assert current_session() is session
+        results.append(session.get_boolean_value("checkout", False))
+
+    middleware = OpenFeatureASGIMiddleware(app, client)
+    scope = {"type": "http", "method": "GET", "path": "/"}
+
+    # When
+    asyncio.run(middleware(scope, None, None))
+    asyncio.run(middleware(scope, None, None))
+
+    # Then
+    assert results == [False, False]
+    assert provider.batch_calls == 1
+    assert provider.single_calls == 1
+    assert provider.batch_thread is not threading.current_thread()
+    assert "openfeature.session" not in scope
+
+
+def test_prefetched_flags_are_resolved_again_for_another_default():
+    # Given
+    client, provider = _client()
+    defaults = iter(["first", "second"])
+    values = []
+
+    def app(environ, start_response):
+        values.append(current_session().get_string_value("banner", next(defaults)))
+        return []
+
+    middleware = OpenFeatureWSGIMiddleware(app, client)
+    environ = {"REQUEST_METHOD": "GET", "PATH_INFO": "/"}
+
+    # When
+    middleware(dict(environ), None)
+    middleware(dict(environ), None)
+
+    # Then
+    assert values == ["first", "second"]
+    assert provider.batch_calls == 1
+
+
+def test_flags_are_not_prefetched_while_before_hooks_are_registered():
+    # Given
+    client, provider = _client()
+
+    class PlanHook(Hook):
+        def before(self, hook_context, hints):
+            return EvaluationContext(attributes={"plan": "pro"})
+
+    client.add_hooks([PlanHook()])
+    values = []
+
+    def app(environ, start_response):
+        values.append(current_session().get_boolean_value("checkout", False))
+        return []
+
+    middleware = OpenFeatureWSGIMiddleware(app, client)
+    environ = {"REQUEST_METHOD": "GET", "PATH_INFO": "/"}
+
+    # When
+    for _ in range(3):
+        middleware(dict(environ), None)
+
+    # Then
+    assert values == [True, True, True]
+    assert provider.batch_calls == 0
+
+
+def test_a_raising_flag_does_not_fail_the_prefetch_of_the_others():
+    # Given
+    class RaisingProvider(InMemoryProvider):
+        batch_calls = 0
+        resolutions = 0
+
+        def get_boolean_details(self, key, *args, **kwargs):
+            self.resolutions += 1
+            if key == "missing":
+                raise FlagNotFoundError("missing")
+            return super().get_boolean_details(key, *args, **kwargs)
+
+        def get_string_details(self, *args, **kwargs):
+            self.resolutions += 1
+            return super().get_string_details(*args, **kwargs)
+
+        def get_details_batch(self, flags, evaluation_context=None):
+            self.batch_calls += 1
+            return super().get_details_batch(flags, evaluation_context)
+
+    provider = RaisingProvider(FLAGS)
+    client = OpenFeatureClient(name=None, version=None, provider=provider)
+    results = []
+
+    def app(environ, start_response):
+        session = current_session()
+        results.append(
+            (
+                session.get_boolean_details("missing", False).error_code,
+                session.get_boolean_value("checkout", False),
+                session.get_string_value("theme", "light"),
+            )
+        )
+        return []
+
+    middleware = OpenFeatureWSGIMiddleware(app, client)
+    environ = {"REQUEST_METHOD": "GET", "PATH_INFO": "/"}
+
+    # When
+    for _ in range(3):
+        middleware(dict(environ), None)
+
+    # Then
+    assert results == [(ErrorCode.FLAG_NOT_FOUND, False, "dark")] * 3
+    assert provider.batch_calls == 2
+    assert provider.resolutions == 9
+
+
+def test_route_flag_learner_is_bounded():
+    # Given
+    learner = RouteFlagLearner(max_routes=2, max_flags_per_route=1)
+
+    # When
+    learner.learn("a", [(FlagType.BOOLEAN, "x", False), (FlagType.BOOLEAN, "y", 1)])
+    learner.learn("b", [])
+    learner.learn("c", [])
+
+    # Then
+    assert learner.flags("a") == []
+    learner.learn("b", [(FlagType.STRING, "z", "")])
+    assert learner.flags("b") == [(FlagType.STRING, "z", "")]
@@ -0,0 +1,89 @@
+import pytest
+
+from open_feature.evaluation_context.evaluation_context import EvaluationContext
+from open_feature.provider.in_memory.flag_evaluator import evaluate_flag
+from open_feature.provider.in_memory.in_memory_flag import (
+    Condition,
+    InMemoryFlag,
+    Operator,
+    TargetingRule,
+)
+
+np = pytest.importorskip("numpy")
+
+from open_feature.provider.in_memory.batch_evaluation import (  # noqa: E402
+    evaluate_flag_batch,
+)
+
+FLAG = InMemoryFlag(
+    variants={"a": "a", "b": "b", "c": "c", "beta": "beta"},
+    default_variant="a",
+    rules=[
+        TargetingRule(
+            variant="beta",
+            conditions=[
+                Condition("country", Operator.IN, ["fr", "de"]),
+                Condition("age", Operator.GREATER_THAN_OR_EQUAL, 30),
+            ],
+        ),
+        TargetingRule(
+            variant="c", conditions=[Condition("plan", Operator.EQUALS, "pro")]
+        ),
+    ],
+    split={"a": 20, "b": 30, "c": 50},
+)
+
+
+def test_batch_evaluation_matches_evaluate_flag():
+    # Given
+    rng = np.random.default_rng(42)
+    size = 2000
+    columns = {
+        "targeting_key": np.array([f"user-{i}" for i in range(size)]),
+        "country": rng.choice(["fr", "de", "us"], size),
+        "age": rng.integers(18, 60, size).astype(float),
+        "plan": rng.choice(np.array(["free", "pro", None], dtype=object), size),
+    }
+    columns["age"][::7] = np.nan
+
+    # When
+    result = evaluate_flag_batch("flag", FLAG, columns)
+
+    # Then
+    for row in range(size):
+        attributes = {
+            name: column[row]
+            for name, column in columns.items()
+            if name != "targeting_key"
+            and column[row] is not None
+            and column[row] == column[row]
+        }
+        context = EvaluationContext(str(columns["targeting_key"][row]), attributes)
+        variant, reason = evaluate_flag("flag", FLAG, context)
+        assert result.variants[row] == variant
+        assert result.reasons[row] == reason.value
+
+
+def test_batch_evaluation_accepts_record_arrays():
+    # Given
+    contexts = np.rec.fromrecords(
+        [("user-1", "fr", 40), ("user-2", "us", 40)],
+        names="targeting_key,country,age",
+    )
+
+    # When
+    result = evaluate_flag_batch("flag", FLAG, contexts)
+
+    # Then
+    assert result.variants[0] == "beta"
+    assert result.reasons[0] == "TARGETING_MATCH"
+    assert result.reasons[1] == "SPLIT"
+
+
+def test_batch_evaluation_rejects_non_string_targeting_keys():
+    # Given
+    contexts = {"targeting_key": np.arange(10)}
+
+    # When / Then
+    with pytest.raises(ValueError):
+        evaluate_flag_batch("flag", FLAG, contexts)
@@ -0,0 +1,176 @@
+import threading
+from unittest import mock
+
+import pytest
+
+from open_feature.exception.exceptions import FlagNotFoundError
+from open_feature.flag_evaluation.error_code import ErrorCode
+from open_feature.flag_evaluation.flag_evaluation_details import FlagEvaluationDetails
+from open_feature.flag_evaluation.reason import Reason
+from open_feature.provider.circuit_breaker_provider import (
+    CircuitBreakerProvider,
+    CircuitState,
+)
+from open_feature.provider.no_op_provider import NoOpProvider
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture()
+def failing_provider():
+    provider = NoOpProvider()
+    provider.get_string_details = mock.MagicMock(
+        return_value=FlagEvaluationDetails(
+            key="Key", value="remote", reason=Reason.TARGETING_MATCH, variant="on"
+        )
+    )
+    return provider
+
+
+def test_circuit_opens_and_serves_last_known_good(failing_provider):
+    # Given
+    clock = FakeClock()
+    provider = CircuitBreakerProvider(
+        failing_provider, window_size=4, minimum_calls=4, clock=clock
+    )
+    provider.get_string_details("Key", "default")
+    failing_provider.get_string_details.side_effect = ConnectionError("down")
+
+    # When
+    for _ in range(3):
+        with pytest.raises(ConnectionError):
+            provider.get_string_details("Key", "default")
+    flag = provider.get_string_details("Key", "default")
+    unknown = provider.get_string_details("Other", "default")
+
+    # Then
+    assert provider.state == CircuitState.OPEN
+    assert flag.value == "remote"
+    assert flag.reason == Reason.CACHED
+    assert unknown.value == "default"
+    assert unknown.error_code == ErrorCode.GENERAL
+    assert failing_provider.get_string_details.call_count == 4
+
+
+def test_slow_calls_open_the_circuit(failing_provider):
+    # Given
+    clock = FakeClock()
+
+    def slow_call(*args):
+        clock.now += 2
+        return FlagEvaluationDetails(key="Key", value="remote", reason=Reason.DEFAULT)
+
+    failing_provider.get_string_details.side_effect = slow_call
+    provider = CircuitBreakerProvider(
+        failing_provider, slow_call_threshold=1, minimum_calls=2, clock=clock
+    )
+
+    # When
+    provider.get_string_details("Key", "default")
+    provider.get_string_details("Key", "default")
+
+    # Then
+    assert provider.state == CircuitState.OPEN
+
+
+def test_half_open_probe_closes_the_circuit(failing_provider):
+    # Given
+    clock = FakeClock()
+    provider = CircuitBreakerProvider(
+        failing_provider, minimum_calls=1, open_duration=10, clock=clock
+    )
+    failing_provider.get_string_details.side_effect = ConnectionError("down")
+    with pytest.raises(ConnectionError):
+        provider.get_string_details("Key", "default")
+    failing_provider.get_string_details.side_effect = None
+
+    # When
+    clock.now = 5
+    still_open = provider.get_string_details("Key", "default")
+    clock.now = 11
+    probe = provider.get_string_details("Key", "default")
+
+    # Then
+    assert still_open.error_code == ErrorCode.GENERAL
+    assert probe.value == "remote"
+    assert provider.state == CircuitState.CLOSED
+
+
+def test_raised_expected_errors_do_not_open_the_circuit(failing_provider):
+    # Given
+    failing_provider.get_string_details.side_effect = FlagNotFoundError()
+    provider = CircuitBreakerProvider(failing_provider, minimum_calls=2)
+
+    # When
+    for _ in range(4):
+        with pytest.raises(FlagNotFoundError):
+            provider.get_string_details("Key", "default")
+
+    # Then
+    assert provider.state == CircuitState.CLOSED
+
+
+def test_only_the_probe_decides_the_half_open_state(failing_provider):
+    # Given
+    clock = FakeClock()
+    provider = CircuitBreakerProvider(
+        failing_provider, minimum_calls=1, open_duration=10, clock=clock
+    )
+    started = threading.Event()
+    release_slow, release_probe = threading.Event(), threading.Event()
+    outcomes = []
+
+    def blocking(release, result):
+        def call(*args):
+            started.set()
+            release.wait(5)
+            return result
+
+        return call
+
+    def evaluate():
+        outcomes.append(provider.get_string_details("Key", "default").value)
+
+    # a call in flight while the circuit opens and a half-open probe starts
+    failing_provider.get_string_details.side_effect = blocking(
+        release_slow,
+        FlagEvaluationDetails(key="Key", value="slow", reason=Reason.TARGETING_MATCH),
+    )
+    slow = threading.Thread(target=evaluate)
+    slow.start()
+    assert started.wait(5)
+    started.clear()
+    failing_provider.get_string_details.side_effect = ConnectionError("down")
+    with pytest.raises(ConnectionError):
+        provider.get_string_details("Key", "default")
+    clock.now = 11
+    failing_provider.get_string_details.side_effect = blocking(
+        release_probe,
+        FlagEvaluationDetails(
+            key="Key",
+            value="default",
+            reason=Reason.ERROR,
+            error_code=ErrorCode.GENERAL,
+        ),
+    )
+    probe = threading.Thread(target=evaluate)
+    probe.start()
+    assert started.wait(5)
+
+    # When
+    release_slow.set()
+    slow.join(5)
+    state_after_slow_call = provider.state
+    release_probe.set()
+    probe.join(5)
+
+    # Then
+    assert state_after_slow_call == CircuitState.HALF_OPEN
+    assert provider.state == CircuitState.OPEN
+    assert outcomes == ["slow", "default"]
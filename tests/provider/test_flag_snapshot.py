@@ -0,0 +1,101 @@
+import pytest
+
+from open_feature.evaluation_context.evaluation_context import EvaluationContext
+from open_feature.exception.exceptions import ParseError
+from open_feature.provider.in_memory.flag_snapshot import (
+    FlagSnapshot,
+    write_flag_snapshot,
+)
+from open_feature.provider.in_memory.in_memory_flag import (
+    Condition,
+    InMemoryFlag,
+    Operator,
+    TargetingRule,
+)
+from open_feature.provider.in_memory.in_memory_provider import InMemoryProvider
+
+FLAGS = {
+    "checkout": InMemoryFlag(
+        variants={"on": True, "off": False},
+        default_variant="off",
+        rules=[
+            TargetingRule(
+                variant="on",
+                conditions=[
+                    Condition("country", Operator.IN, ["fr", "de"]),
+                    Condition("age", Operator.GREATER_THAN, 30),
+                ],
+            )
+        ],
+    ),
+    "banner": InMemoryFlag(
+        variants={"a": "blue", "b": "red"},
+        default_variant="a",
+        split={"a": 50, "b": 50},
+        enabled=False,
+    ),
+    "limits": InMemoryFlag(
+        variants={"default": {"rps": 10, "regions": ["eu"]}},
+        default_variant="default",
+    ),
+}
+
+
+def test_snapshot_round_trips_flag_definitions(tmp_path):
+    # Given
+    path = str(tmp_path / "flags.bin")
+    write_flag_snapshot(FLAGS, path)
+
+    # When
+    with FlagSnapshot(path) as snapshot:
+        flags = dict(snapshot)
+
+    # Then
+    assert flags == FLAGS
+
+
+def test_provider_evaluates_flags_from_snapshot(tmp_path):
+    # Given
+    path = str(tmp_path / "flags.bin")
+    write_flag_snapshot(FLAGS, path)
+    provider = InMemoryProvider(FlagSnapshot(path))
+
+    # When
+    checkout = provider.get_boolean_details(
+        "checkout", False, EvaluationContext("user", {"country": "de", "age": 40})
+    )
+    missing = provider.get_boolean_details("missing", False)
+
+    # Then
+    assert checkout.value is True
+    assert missing.error_code is not None
+
+
+def test_snapshot_rejects_other_files(tmp_path):
+    # Given
+    path = tmp_path / "flags.json"
+    path.write_text('{"flags": {}, "padding": "to reach the header size"}')
+
+    # When / Then
+    with pytest.raises(ParseError):
+        FlagSnapshot(str(path))
+
+
+def test_updates_leave_snapshot_flags_undecoded(tmp_path):
+    # Given
+    path = str(tmp_path / "flags.bin")
+    write_flag_snapshot(FLAGS, path)
+    snapshot = FlagSnapshot(path)
+    provider = InMemoryProvider(snapshot)
+    banner = InMemoryFlag(variants={"a": "green"}, default_variant="a")
+
+    # When
+    provider.update_flags({"banner": banner})
+    provider.update_flags({"limits": None})
+    value = provider.get_string_details("banner", "").value
+
+    # Then
+    assert set(snapshot._flags) == {"banner", "limits"}
+    assert value == "green"
+    assert dict(provider.flags) == {"checkout": FLAGS["checkout"], "banner": banner}
+    assert len(provider.flags) == 2
@@ -0,0 +1,136 @@
+from types import MappingProxyType
+
+from open_feature.evaluation_context.evaluation_context import EvaluationContext
+from open_feature.flag_evaluation.error_code import ErrorCode
+from open_feature.flag_evaluation.reason import Reason
+from open_feature.provider.in_memory.in_memory_flag import (
+    Condition,
+    InMemoryFlag,
+    Operator,
+    TargetingRule,
+)
+from open_feature.provider.in_memory.in_memory_provider import InMemoryProvider
+
+FLAGS = {
+    "checkout": InMemoryFlag(
+        variants={"on": True, "off": False},
+        default_variant="off",
+        rules=[
+            TargetingRule(
+                variant="on",
+                conditions=[Condition("country", Operator.IN, ["fr", "de"])],
+            )
+        ],
+    ),
+    "banner": InMemoryFlag(
+        variants={"a": "blue", "b": "red"},
+        default_variant="a",
+        split={"a": 50, "b": 50},
+    ),
+    "limits": InMemoryFlag(
+        variants={"default": '{"rps": 10}'}, default_variant="default"
+    ),
+    "disabled": InMemoryFlag(
+        variants={"on": True}, default_variant="on", enabled=False
+    ),
+    "malformed": InMemoryFlag(variants={"v": "{rps: 10"}, default_variant="v"),
+}
+
+
+def test_should_serve_targeted_variant():
+    # Given
+    provider = InMemoryProvider(FLAGS)
+
+    # When
+    flag = provider.get_boolean_details(
+        "checkout", False, EvaluationContext("user", {"country": "fr"})
+    )
+
+    # Then
+    assert flag.value is True
+    assert flag.variant == "on"
+    assert flag.reason == Reason.TARGETING_MATCH
+
+
+def test_should_split_by_targeting_key():
+    # Given
+    provider = InMemoryProvider(FLAGS)
+
+    # When
+    values = {
+        provider.get_string_details("banner", "", EvaluationContext(f"user-{i}")).value
+        for i in range(100)
+    }
+
+    # Then
+    assert values == {"blue", "red"}
+
+
+def test_should_serve_shared_read_only_object_value():
+    # Given
+    provider = InMemoryProvider(FLAGS)
+
+    # When
+    first = provider.get_object_details("limits", {}).value
+    second = provider.get_object_details("limits", {}).value
+
+    # Then
+    assert isinstance(first, MappingProxyType)
+    assert first is second
+    assert first["rps"] == 10
+
+
+def test_should_return_error_details_for_missing_and_mistyped_flags():
+    # Given
+    provider = InMemoryProvider(FLAGS)
+
+    # When
+    missing = provider.get_boolean_details("missing", True)
+    mistyped = provider.get_number_details("banner", 1)
+
+    # Then
+    assert missing.value is True
+    assert missing.error_code == ErrorCode.FLAG_NOT_FOUND
+    assert mistyped.value == 1
+    assert mistyped.error_code == ErrorCode.TYPE_MISMATCH
+
+
+def test_disabled_flag_should_serve_default_value():
+    # Given
+    provider = InMemoryProvider(FLAGS)
+
+    # When
+    flag = provider.get_boolean_details("disabled", False)
+
+    # Then
+    assert flag.value is False
+    assert flag.reason == Reason.DISABLED
+
+
+def test_reassigned_flags_should_not_serve_cached_object_values():
+    # Given
+    provider = InMemoryProvider(
+        {"limits": InMemoryFlag(variants={"v": {"rps": 1}}, default_variant="v")}
+    )
+    provider.get_object_details("limits", {})
+
+    # When
+    provider.flags = {
+        "limits": InMemoryFlag(variants={"v": {"rps": 2}}, default_variant="v")
+    }
+
+    # Then
+    assert provider.get_object_details("limits", {}).value["rps"] == 2
+
+
+def test_should_return_parse_error_for_malformed_object_variant():
+    # Given
+    provider = InMemoryProvider(FLAGS)
+
+    # When
+    flag = provider.get_object_details("malformed", {"rps": 1})
+
+    # Then
+    assert flag.value == {"rps": 1}
+    assert flag.reason == Reason.ERROR
+    assert flag.error_code == ErrorCode.PARSE_ERROR
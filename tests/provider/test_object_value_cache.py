@@ -0,0 +1,40 @@
+from open_feature.provider.object_value_cache import ObjectValueCache
+
+
+def test_variant_is_decoded_once_per_version_and_shared():
+    # Given
+    cache = ObjectValueCache()
+
+    # When
+    first = cache.get("Key", "on", '{"String": "string", "Number": 2}', version=1)
+    second = cache.get("Key", "on", '{"String": "string", "Number": 2}', version=1)
+
+    # Then
+    assert first is second
+    assert first == {"String": "string", "Number": 2}
+
+
+def test_new_version_builds_new_value():
+    # Given
+    cache = ObjectValueCache()
+    first = cache.get("Key", "on", {"Number": 1}, version=1)
+
+    # When
+    second = cache.get("Key", "on", {"Number": 2}, version=2)
+
+    # Then
+    assert first["Number"] == 1
+    assert second["Number"] == 2
+
+
+def test_invalidate_drops_flag_values():
+    # Given
+    cache = ObjectValueCache()
+    cache.get("Key", "on", {"Number": 1}, version=1)
+
+    # When
+    cache.invalidate("Key")
+    value = cache.get("Key", "on", {"Number": 2}, version=1)
+
+    # Then
+    assert value["Number"] == 2
@@ -0,0 +1,86 @@
+import random
+from decimal import Decimal
+
+from open_feature.evaluation_context.evaluation_context import EvaluationContext
+from open_feature.provider.in_memory.flag_evaluator import match_rule
+from open_feature.provider.in_memory.in_memory_flag import (
+    Condition,
+    Operator,
+    TargetingRule,
+)
+from open_feature.provider.in_memory.rule_index import RuleIndex
+
+
+def _random_rules(rng, count):
+    rules = []
+    for i in range(count):
+        conditions = [
+            rng.choice(
+                [
+                    Condition("plan", Operator.EQUALS, rng.choice(["free", "pro"])),
+                    Condition("user", Operator.IN, [rng.randrange(500) for _ in "ab"]),
+                    Condition("age", Operator.GREATER_THAN, rng.randrange(100)),
+                    Condition("age", Operator.LESS_THAN_OR_EQUAL, rng.randrange(100)),
+                    Condition("plan", Operator.NOT_EQUALS, "free"),
+                ]
+            )
+            for _ in range(rng.randrange(1, 3))
+        ]
+        rules.append(TargetingRule(variant=f"v{i}", conditions=conditions))
+    return rules
+
+
+def test_rule_index_matches_like_a_full_scan():
+    # Given
+    rng = random.Random(7)
+    rules = _random_rules(rng, 300)
+    rule_index = RuleIndex(rules)
+
+    for _ in range(500):
+        # When
+        context = EvaluationContext(
+            attributes={
+                "plan": rng.choice(["free", "pro", None]),
+                "user": rng.randrange(600),
+                "age": rng.choice(
+                    [rng.randrange(100), Decimal(rng.randrange(100)), "unknown", True]
+                ),
+            }
+        )
+
+        # Then
+        assert rule_index.match(context) is match_rule(rules, context)
+
+
+def test_rule_index_only_selects_rules_for_context_values():
+    # Given
+    rules = [
+        TargetingRule(f"v{i}", [Condition("user", Operator.EQUALS, f"user-{i}")])
+        for i in range(1000)
+    ]
+    rule_index = RuleIndex(rules)
+
+    # When
+    context = EvaluationContext(attributes={"user": "user-42"})
+    candidates = rule_index.candidates(context)
+
+    # Then
+    assert candidates == {42}
+
+
+def test_rule_index_skips_range_rules_for_missing_or_non_numeric_values():
+    # Given
+    rules = [
+        TargetingRule(f"v{i}", [Condition("age", Operator.GREATER_THAN, i)])
+        for i in range(1000)
+    ]
+    rule_index = RuleIndex(rules)
+
+    # When
+    missing = rule_index.candidates(EvaluationContext(attributes={"plan": "pro"}))
+    text = rule_index.candidates(EvaluationContext(attributes={"age": "unknown"}))
+    number = rule_index.candidates(EvaluationContext(attributes={"age": 3}))
+
+    # Then
+    assert missing == text == set()
+    assert number == {0, 1, 2}
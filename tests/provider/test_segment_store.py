@@ -0,0 +1,101 @@
+import pytest
+
+from open_feature.evaluation_context.evaluation_context import EvaluationContext
+from open_feature.exception.exceptions import ParseError
+from open_feature.provider.in_memory.in_memory_flag import (
+    Condition,
+    InMemoryFlag,
+    Operator,
+    TargetingRule,
+)
+from open_feature.provider.in_memory.in_memory_provider import InMemoryProvider
+from open_feature.provider.segment_store import HashedKeySet, SegmentStore, key_hash
+
+
+def test_segment_membership_with_bloom_filter():
+    # Given
+    store = SegmentStore()
+    store.add("beta", (f"user-{i}" for i in range(10000)), bloom_filter=True)
+
+    # When / Then
+    assert store.contains("beta", "user-42")
+    assert not store.contains("beta", "user-10001")
+    assert store.contains("unknown", "user-42") is None
+
+
+def test_memory_mapped_segment(tmp_path):
+    # Given
+    path = str(tmp_path / "beta.keys")
+    HashedKeySet.from_keys(f"user-{i}" for i in range(1000)).write(path)
+    store = SegmentStore()
+
+    # When
+    store.add_file("beta", path)
+
+    # Then
+    assert store.contains("beta", "user-999")
+    assert not store.contains("beta", "user-1000")
+
+
+def test_key_set_file_stores_little_endian_hashes(tmp_path):
+    # Given
+    path = tmp_path / "beta.keys"
+
+    # When
+    HashedKeySet.from_keys(["user-1"]).write(str(path))
+
+    # Then
+    assert int.from_bytes(path.read_bytes()[-8:], "little") == key_hash("user-1")
+
+
+def test_open_rejects_other_files(tmp_path):
+    # Given
+    path = tmp_path / "beta.txt"
+    path.write_text("user-1\nuser-2\n")
+
+    # When / Then
+    with pytest.raises(ParseError):
+        HashedKeySet.open(str(path))
+
+
+def test_open_rejects_empty_and_truncated_files(tmp_path):
+    # Given
+    empty = tmp_path / "empty.keys"
+    empty.write_bytes(b"")
+    truncated = tmp_path / "truncated.keys"
+    HashedKeySet.from_keys([f"user-{i}" for i in range(1000)]).write(str(truncated))
+    truncated.write_bytes(truncated.read_bytes()[: -8 * 999 - 3])
+
+    # When / Then
+    for path in (empty, truncated):
+        with pytest.raises(ParseError):
+            HashedKeySet.open(str(path))
+
+
+def test_provider_targets_segment_members():
+    # Given
+    store = SegmentStore()
+    store.add("deny", ["user-1"])
+    flags = {
+        "checkout": InMemoryFlag(
+            variants={"on": True, "off": False},
+            default_variant="on",
+            rules=[
+                TargetingRule(
+                    "off",
+                    [Condition("targeting_key", Operator.IN_SEGMENT, "deny")],
+                )
+            ],
+        )
+    }
+    provider = InMemoryProvider(flags, segments=store)
+
+    # When
+    denied = provider.get_boolean_details("checkout", True, EvaluationContext("user-1"))
+    allowed = provider.get_boolean_details(
+        "checkout", True, EvaluationContext("user-2")
+    )
+
+    # Then
+    assert denied.value is False
+    assert allowed.value is True
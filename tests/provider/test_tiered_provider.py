@@ -0,0 +1,148 @@
+from open_feature.evaluation_context.evaluation_context import EvaluationContext
+from open_feature.flag_evaluation.reason import Reason
+from open_feature.provider.count_min_sketch import CountMinSketch
+from open_feature.provider.in_memory.in_memory_flag import InMemoryFlag
+from open_feature.provider.in_memory.in_memory_provider import InMemoryProvider
+from open_feature.provider.tiered_provider import TieredProvider
+
+
+class CountingProvider(InMemoryProvider):
+    def __init__(self, flags):
+        super().__init__(flags)
+        self.calls = 0
+
+    def get_details_batch(self, flags, evaluation_context=None):
+        self.calls += 1
+        return super().get_details_batch(flags, evaluation_context)
+
+
+def _flag(value, enabled=True):
+    return InMemoryFlag(variants={"v": value}, default_variant="v", enabled=enabled)
+
+
+def _tiered(**kwargs):
+    remote = CountingProvider(
+        {
+            "hot": _flag(True),
+            "cold": _flag({"a": 1}),
+            "disabled": _flag("on", enabled=False),
+        }
+    )
+    return TieredProvider(remote, refresh_interval=None, **kwargs), remote
+
+
+def test_count_min_sketch_estimates_and_ages():
+    # Given
+    sketch = CountMinSketch(width=64, depth=4, sample_size=1000)
+
+    # When
+    for _ in range(10):
+        sketch.add("hot")
+    sketch.add("cold")
+
+    # Then
+    assert sketch.estimate("hot") >= 10
+    assert sketch.estimate("unknown") <= sketch.estimate("hot")
+    sketch.age()
+    assert sketch.estimate("hot") >= 5
+    assert sketch.estimate("cold") == 0
+
+
+def test_hot_flags_are_promoted_into_the_local_tier():
+    # Given
+    provider, remote = _tiered(promotion_threshold=3)
+    context = EvaluationContext("user-1")
+
+    # When
+    results = [provider.get_boolean_details("hot", False, context) for _ in range(10)]
+
+    # Then
+    assert remote.calls == 3
+    assert results[-1].value is True
+    assert results[-1].reason == Reason.CACHED
+    assert provider.get_boolean_details("hot", False).reason != Reason.CACHED
+
+
+def test_default_variants_of_flags_without_rules_are_promoted():
+    # Given
+    provider, remote = _tiered(promotion_threshold=3)
+    kill_switch = InMemoryFlag(
+        variants={"on": True, "off": False}, default_variant="on"
+    )
+    remote.update_flags({"kill": kill_switch})
+
+    # When
+    results = [provider.get_boolean_details("kill", False) for _ in range(100)]
+
+    # Then
+    assert remote.calls == 3
+    assert results[-1].value is True
+    assert results[-1].variant == "on"
+    assert results[-1].reason == Reason.CACHED
+
+
+def test_full_local_tier_only_admits_hotter_flags():
+    # Given
+    provider, remote = _tiered(promotion_threshold=1, max_entries=1)
+    for _ in range(5):
+        provider.get_boolean_details("hot", False)
+
+    # When
+    provider.get_object_details("cold", {})
+    calls = remote.calls
+    provider.get_boolean_details("hot", False)
+
+    # Then
+    assert remote.calls == calls
+
+
+def test_refresh_evicts_cold_flags_and_follows_flag_changes():
+    # Given
+    provider, remote = _tiered(promotion_threshold=2)
+    for _ in range(3):
+        provider.get_boolean_details("hot", False)
+        provider.get_object_details("cold", {})
+
+    # When
+    provider.sketch.age()
+    for _ in range(3):
+        provider.get_boolean_details("hot", False)
+    provider.refresh()
+    remote.update_flags({"hot": _flag(False)})
+    calls = remote.calls
+    details = provider.get_boolean_details("hot", True)
+
+    # Then
+    assert remote.calls == calls + 1
+    assert details.value is False
+    assert provider.get_object_details("cold", {}).reason != Reason.CACHED
+
+
+def test_results_carrying_the_default_value_are_not_promoted():
+    # Given
+    provider, remote = _tiered(promotion_threshold=1)
+    for _ in range(3):
+        provider.get_string_details("disabled", "a")
+
+    # When
+    provider.refresh()
+    details = provider.get_string_details("disabled", "b")
+
+    # Then
+    assert details.value == "b"
+    assert details.reason == Reason.DISABLED
+
+
+def test_refresh_drops_results_which_fell_back_to_the_default():
+    # Given
+    provider, remote = _tiered(promotion_threshold=1)
+    provider.get_boolean_details("hot", False)
+    remote.flags = {"hot": _flag(True, enabled=False)}
+
+    # When
+    provider.refresh()
+    details = provider.get_boolean_details("hot", False)
+
+    # Then
+    assert details.value is False
+    assert details.reason == Reason.DISABLED
@@ -0,0 +1,143 @@
+from open_feature.evaluation_context.evaluation_context import EvaluationContext
+from open_feature.open_feature_client import OpenFeatureClient
+from open_feature.provider.in_memory.in_memory_flag import (
+    Condition,
+    InMemoryFlag,
+    Operator,
+    TargetingRule,
+)
+from open_feature.provider.in_memory.in_memory_provider import InMemoryProvider
+from open_feature.provider.no_op_provider import NoOpProvider
+from open_feature.recording.evaluation_log import (
+    EvaluationLogWriter,
+    read_evaluation_log,
+)
+from open_feature.recording.recording_hook import RecordingHook
+from open_feature.recording.replay import main, replay
+
+FLAGS = {
+    "checkout": InMemoryFlag(
+        variants={"on": True, "off": False},
+        default_variant="off",
+        rules=[
+            TargetingRule("on", [Condition("email", Operator.EQUALS, "a@b.c")]),
+        ],
+    ),
+    "limits": InMemoryFlag(variants={"v1": {"rps": 10}}, default_variant="v1"),
+}
+
+
+def _provider():
+    return InMemoryProvider(FLAGS)
+
+
+def _record(path):
+    with EvaluationLogWriter(path) as writer:
+        client = OpenFeatureClient(
+            name=None,
+            version=None,
+            hooks=[RecordingHook(writer, recorded_attributes=["plan"])],
+            provider=InMemoryProvider(FLAGS),
+        )
+        for i in range(10):
+            # only the first context is targeted, on its redacted email
+            email = f"{i}@b.c" if i else "a@b.c"
+            context = EvaluationContext(f"user-{i}", {"email": email, "plan": "pro"})
+            client.get_boolean_value("checkout", False, context)
+            client.get_object_value("limits", {}, context)
+        client.get_string_value("missing", "default")
+
+
+def test_recording_hook_writes_sanitized_records(tmp_path):
+    # Given
+    path = str(tmp_path / "evaluations.jsonl.gz")
+
+    # When
+    _record(path)
+    records = list(read_evaluation_log(path))
+
+    # Then
+    assert len(records) == 21
+    assert records[0].attributes["email"].startswith("redacted:")
+    assert records[0].attributes["plan"] == "pro"
+    assert records[0].redacted == ["email"]
+    assert records[0].value is True
+    assert records[1].value == {"rps": 10}
+    assert records[-1].error_code == "FLAG_NOT_FOUND"
+
+
+def test_replay_against_same_provider_only_diffs_on_redacted_targeting(tmp_path):
+    # Given
+    path = str(tmp_path / "evaluations.jsonl")
+    _record(path)
+    client = OpenFeatureClient(
+        name=None, version=None, provider=InMemoryProvider(FLAGS)
+    )
+
+    # When
+    report = replay(client, read_evaluation_log(path))
+
+    # Then
+    assert report.evaluations == 21
+    assert report.diff_count == report.redacted_diff_count == 1
+    assert report.diffs[0].redacted
+    assert set(report.latencies) == {50, 90, 99, 100}
+
+
+def test_replay_reports_diffs(tmp_path):
+    # Given
+    path = str(tmp_path / "evaluations.jsonl")
+    _record(path)
+    client = OpenFeatureClient(name=None, version=None, provider=NoOpProvider())
+
+    # When
+    report = replay(client, read_evaluation_log(path))
+
+    # Then
+    assert report.diff_count == 21
+    # only the targeted evaluation may come from its redacted email
+    assert report.redacted_diff_count == 1
+    assert report.diffs[1].expected["value"] == {"rps": 10}
+
+
+def test_replay_cli_fails_on_redacted_diffs_unless_allowed(tmp_path, capsys):
+    # Given
+    path = str(tmp_path / "evaluations.jsonl")
+    _record(path)
+    args = [path, "--provider", f"{__name__}:_provider"]
+
+    # When
+    strict = main(args)
+    tolerant = main(args + ["--allow-redacted-diffs"])
+    broken = main(
+        [
+            path,
+            "--provider",
+            "open_feature.provider.no_op_provider:NoOpProvider",
+            "--allow-redacted-diffs",
+        ]
+    )
+
+    # Then
+    assert (strict, tolerant, broken) == (1, 0, 1)
+    assert "redacted_diffs=1" in capsys.readouterr().out
+
+
+def test_recording_failures_do_not_fail_the_evaluation(tmp_path):
+    # Given
+    writer = EvaluationLogWriter(str(tmp_path / "evaluations.jsonl"))
+    writer.close()
+    client = OpenFeatureClient(
+        name=None,
+        version=None,
+        hooks=[RecordingHook(writer)],
+        provider=InMemoryProvider(FLAGS),
+    )
+    context = EvaluationContext("user-0", {"email": "a@b.c"})
+
+    # When
+    details = client.get_boolean_details("checkout", False, context)
+
+    # Then
+    assert details.value is True
+    assert details.error_code is None
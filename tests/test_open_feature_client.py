@@ -0,0 +1,106 @@
+from unittest import mock
+
+from open_feature.exception.exceptions import FlagNotFoundError
+from open_feature.flag_evaluation.error_code import ErrorCode
+from open_feature.flag_evaluation.flag_evaluation_details import FlagEvaluationDetails
+from open_feature.flag_evaluation.reason import Reason
+from open_feature.hooks.hook import Hook
+from open_feature.open_feature_client import OpenFeatureClient
+from open_feature.provider.no_op_provider import NoOpProvider
+
+
+def test_should_return_default_when_provider_returns_error_details():
+    # Given
+    provider = NoOpProvider()
+    provider.get_string_details = mock.MagicMock(
+        return_value=FlagEvaluationDetails(
+            key="Key",
+            value=None,
+            reason=Reason.ERROR,
+            error_code=ErrorCode.FLAG_NOT_FOUND,
+            error_message="Key not found",
+        )
+    )
+    client = OpenFeatureClient(name=None, version=None, provider=provider)
+
+    # When
+    flag = client.get_string_details(key="Key", default_value="default")
+
+    # Then
+    assert flag.value == "default"
+    assert flag.reason == Reason.ERROR
+    assert flag.error_code == ErrorCode.FLAG_NOT_FOUND
+    assert flag.error_message == "Key not found"
+
+
+def test_should_return_error_code_when_provider_raises_open_feature_error():
+    # Given
+    provider = NoOpProvider()
+    provider.get_boolean_details = mock.MagicMock(
+        side_effect=FlagNotFoundError("Key not found")
+    )
+    client = OpenFeatureClient(name=None, version=None, provider=provider)
+
+    # When
+    flag = client.get_boolean_details(key="Key", default_value=True)
+
+    # Then
+    assert flag.value is True
+    assert flag.reason == Reason.ERROR
+    assert flag.error_code == ErrorCode.FLAG_NOT_FOUND
+    assert flag.error_message == "Key not found"
+
+
+def test_should_return_general_error_code_when_provider_raises_exception():
+    # Given
+    provider = NoOpProvider()
+    provider.get_number_details = mock.MagicMock(side_effect=ValueError("boom"))
+    client = OpenFeatureClient(name=None, version=None, provider=provider)
+
+    # When
+    flag = client.get_number_details(key="Key", default_value=1)
+
+    # Then
+    assert flag.value == 1
+    assert flag.error_code == ErrorCode.GENERAL
+    assert flag.error_message == "boom"
+
+
+def test_should_only_run_implemented_hook_stages():
+    # Given
+    class AfterHook(Hook):
+        def __init__(self):
+            self.details = []
+
+        def after(self, hook_context, details, hints):
+            self.details.append(details)
+
+    hook = AfterHook()
+    client = OpenFeatureClient(
+        name=None, version=None, hooks=[hook], provider=NoOpProvider()
+    )
+
+    # When
+    with mock.patch.object(Hook, "before") as before:
+        client.get_boolean_details(key="Key", default_value=True)
+
+    # Then
+    before.assert_not_called()
+    assert len(hook.details) == 1
+    assert hook.details[0].value is True
+
+
+def test_should_run_hooks_added_after_creation():
+    # Given
+    mock_hook = mock.MagicMock()
+    mock_hook.before.return_value = None
+    client = OpenFeatureClient(name=None, version=None, provider=NoOpProvider())
+
+    # When
+    client.add_hooks([mock_hook])
+    client.get_boolean_details(key="Key", default_value=True)
+
+    # Then
+    assert client.hooks == (mock_hook,)
+    mock_hook.before.assert_called_once()
+    mock_hook.after.assert_called_once()
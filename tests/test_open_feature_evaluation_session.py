@@ -0,0 +1,55 @@
+from unittest import mock
+
+from open_feature.evaluation_context.evaluation_context import EvaluationContext
+from open_feature.flag_evaluation.reason import Reason
+from open_feature.open_feature_client import OpenFeatureClient
+from open_feature.provider.no_op_provider import NoOpProvider
+
+
+def test_session_evaluates_each_flag_once():
+    # Given
+    provider = NoOpProvider()
+    client = OpenFeatureClient(name=None, version=None, provider=provider)
+    session = client.evaluation_session(EvaluationContext("user"))
+
+    # When
+    with mock.patch.object(
+        provider, "get_boolean_details", wraps=provider.get_boolean_details
+    ) as spy:
+        first = session.get_boolean_details(key="Key", default_value=True)
+        second = session.get_boolean_value(key="Key", default_value=False)
+
+    # Then
+    spy.assert_called_once()
+    assert first.reason == Reason.DEFAULT
+    assert second is True
+
+
+def test_session_memoizes_per_flag_type():
+    # Given
+    provider = NoOpProvider()
+    client = OpenFeatureClient(name=None, version=None, provider=provider)
+    session = client.evaluation_session()
+
+    # When
+    string_value = session.get_string_value(key="Key", default_value="String")
+    number_value = session.get_number_value(key="Key", default_value=100)
+
+    # Then
+    assert string_value == "String"
+    assert number_value == 100
+
+
+def test_cleared_session_evaluates_flags_again():
+    # Given
+    provider = NoOpProvider()
+    client = OpenFeatureClient(name=None, version=None, provider=provider)
+    session = client.evaluation_session()
+    session.get_string_value(key="Key", default_value="first")
+
+    # When
+    session.clear()
+    value = session.get_string_value(key="Key", default_value="second")
+
+    # Then
+    assert value == "second"